@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from typing_extensions import override
 
@@ -45,6 +46,38 @@ _LOGGER = logging.getLogger(__name__)
 HEARTBEAT_INTERVAL = 15
 
 
+@lru_cache(maxsize=64)
+def _plan_batches(register_names: tuple[str, ...]) -> tuple[tuple[str, ...], ...]:
+    """Split the registers into batches that can each be retrieved with a single read."""
+    registers = sorted(((name, REGISTERS[name]) for name in register_names), key=lambda item: item[1].register)
+
+    batches: list[tuple[str, ...]] = []
+    first_idx = 0
+    while first_idx < len(registers):
+        # Batch together registers:
+        # - as long as the total amount of registers doesn't exceed 64
+        # - as long as the gap between registers is not more than 16
+        batch_start = registers[first_idx][1].register
+        last_idx = first_idx
+        last_end = batch_start + registers[first_idx][1].length - 1
+
+        while last_idx + 1 < len(registers):
+            next_register = registers[last_idx + 1][1]
+            next_end = next_register.register + next_register.length - 1
+            if (
+                next_end - batch_start > MAX_BATCHED_REGISTERS_COUNT
+                or next_register.register - last_end >= MAX_BATCHED_REGISTERS_GAP
+            ):
+                break
+            last_idx += 1
+            last_end = next_end
+
+        batches.append(tuple(name for name, _ in registers[first_idx : last_idx + 1]))
+        first_idx = last_idx + 1
+
+    return tuple(batches)
+
+
 @dataclass(frozen=True)
 class HuaweiSolarProductInfo:
     """Contains information on Huawei Solar Product."""
@@ -187,49 +220,16 @@ class HuaweiSolarBridge(ABC):
         if any(register_name not in REGISTERS for register_name in register_names):
             _LOGGER.warning("Unknown register name passed to batch_update")
 
-        class _Register:
-            name: str
-            register_start: int
-            register_end: int
-
-            def __init__(self, regname: str) -> None:
-                self.name = regname
-
-                reg = REGISTERS[regname]
-                self.register_start = reg.register
-                self.register_end = reg.register + reg.length - 1
-
-        registers = [_Register(rn) for rn in register_names]
-
-        registers.sort(key=lambda rd: rd.register_start)
-
         async with self.update_lock:
             result: dict[str, Result] = {}
-            first_idx = 0
-            last_idx = 0
-
-            while first_idx < len(registers):
-                # Batch together registers:
-                # - as long as the total amount of registers doesn't exceed 64
-                # - as long as the gap between registers is not more than 16
-
-                while (
-                    last_idx + 1 < len(registers)
-                    and registers[last_idx + 1].register_end - registers[first_idx].register_start
-                    <= MAX_BATCHED_REGISTERS_COUNT
-                    and registers[last_idx + 1].register_start - registers[last_idx].register_end
-                    < MAX_BATCHED_REGISTERS_GAP
-                ):
-                    last_idx += 1
-
-                register_names_to_query = [reg.name for reg in registers[first_idx : last_idx + 1]]
-                register_names_to_query = await self._filter_registers(
-                    register_names_to_query,
-                )
-                _LOGGER.debug(
-                    "Batch update of the following registers: %s",
-                    ", ".join(register_names_to_query),
-                )
+
+            for batch in _plan_batches(tuple(register_names)):
+                register_names_to_query = await self._filter_registers(list(batch))
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Batch update of the following registers: %s",
+                        ", ".join(register_names_to_query),
+                    )
 
                 try:
                     values = await self._get_multiple_to_dict(register_names_to_query)
@@ -239,9 +239,6 @@ class HuaweiSolarBridge(ABC):
                 self._detect_state_changes(values)
                 result.update(values)
 
-                first_idx = last_idx + 1
-                last_idx = first_idx
-
             for key, value in result.items():
                 result[key] = self._transform_register_values(key, value)
 
@@ -410,6 +407,7 @@ class HuaweiSUN2000Bridge(HuaweiSolarBridge):
 
     _time_zone: int | None = None
     _dst: bool | None = None
+    _timestamp_offset = timedelta(0)
 
     _previous_device_status: str | None = None
 
@@ -475,9 +473,16 @@ class HuaweiSUN2000Bridge(HuaweiSolarBridge):
         if self.power_meter_online:
             self.power_meter_type = (await self.client.get(rn.METER_TYPE, self.slave_id)).value
 
+        await self._update_time_zone()
+
+    async def _update_time_zone(self) -> None:
+        """Read the time zone and DST setting, which are needed to convert timestamps to UTC."""
         self._dst = (await self.client.get(rn.DAYLIGHT_SAVING_TIME, self.slave_id)).value
         self._time_zone = (await self.client.get(rn.TIME_ZONE, self.slave_id)).value
 
+        # timestamps are reported in local time: shift them by the time zone, and another hour if DST is in effect
+        self._timestamp_offset = timedelta(minutes=self._time_zone or 0, hours=1 if self._dst else 0)
+
     @override
     def _handle_batch_read_error(self, queried_register_names: list[str], exc: HuaweiSolarException) -> None:
         """Handle read errors in batch_update."""
@@ -522,7 +527,7 @@ class HuaweiSUN2000Bridge(HuaweiSolarBridge):
 
         # Filter out power meter registers if the power meter is offline
         power_meter_register_names = {rn for rn in register_names if rn in METER_REGISTERS}
-        if len(power_meter_register_names):
+        if power_meter_register_names:
             # Do a check of the METER_STATUS register only if the power meter is marked offline
             if not self.power_meter_online:
                 power_meter_online_register = await self.client.get(
@@ -551,14 +556,7 @@ class HuaweiSUN2000Bridge(HuaweiSolarBridge):
     def _transform_register_values(self, register_name: str, result: Result) -> Result:
         if isinstance(REGISTERS[register_name], TimestampRegister) and result.value is not None:
             assert isinstance(result.value, datetime)
-            value = result.value
-            if self._time_zone:
-                value -= timedelta(minutes=self._time_zone)
-            # if DST is in effect, we need to shift another hour.
-            if self._dst:
-                value -= timedelta(hours=1)
-
-            return Result(value.astimezone(tz=UTC), result.unit)
+            return Result((result.value - self._timestamp_offset).astimezone(tz=UTC), result.unit)
 
         return result
 
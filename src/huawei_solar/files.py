@@ -103,6 +103,8 @@ class OptimizerRealTimeDataFile:
         )
         offset += struct.calcsize(OptimizerRealTimeDataFile.HEADER)
 
+        local_timezone = get_local_timezone()
+
         has_next_optimizer_data_unit = True
         while has_next_optimizer_data_unit:
             (time, length, number_of_optimizers) = struct.unpack_from(
@@ -156,7 +158,7 @@ class OptimizerRealTimeDataFile:
 
             self.data_units.append(
                 OptimizerHistoryRealTimeDataUnit(
-                    datetime.fromtimestamp(time, tz=get_local_timezone()),
+                    datetime.fromtimestamp(time, tz=local_timezone),
                     optimizers,
                 ),
             )
@@ -10,6 +10,7 @@ import time
 import typing as t
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
 from typing import cast
 
@@ -17,7 +18,7 @@ import backoff
 from pymodbus.constants import Endian
 from pymodbus.exceptions import ConnectionException as ModbusConnectionException
 from pymodbus.message.rtu import MessageRTU
-from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
+from pymodbus.payload import BinaryPayloadBuilder
 from pymodbus.pdu import ExceptionResponse, ModbusExceptions, ModbusRequest
 from pymodbus.register_write_message import (
     WriteMultipleRegistersResponse,
@@ -86,6 +87,68 @@ def _compute_digest(password, seed):
     return hmac.digest(key=hashed_password, msg=seed, digest=sha256)
 
 
+class _ReadPlan(t.NamedTuple):
+    """Registers to decode from a single read, with their byte offset in the response."""
+
+    start: int
+    length: int
+    registers: tuple[tuple[RegisterDefinition, int], ...]
+    payload: struct.Struct
+
+
+@lru_cache(maxsize=256)
+def _plan_read(names: tuple[str, ...]) -> _ReadPlan:  # noqa: C901
+    """Validate a multi-register read and compute where each register is located in the response."""
+    if len(names) == 0:
+        raise ValueError("Expected at least one register name")
+
+    registers = list(map(REGISTERS.get, names))
+
+    if None in registers:
+        missing_registers = set(names) - set(REGISTERS.keys())
+        if missing_registers:
+            raise ValueError(f"Did not recognize register names: {', '.join(missing_registers)}")
+        raise ValueError("Did not recognize all register names")
+    registers = t.cast(list[RegisterDefinition], registers)
+
+    for register, register_name in zip(registers, names, strict=False):
+        if not register.readable:
+            raise ValueError(f"Trying to read unreadable register {register_name}")
+
+    start = registers[0].register
+    # track the end of the longest register at the previous address, as aliases can have different lengths
+    prev_start, prev_end = start, start + registers[0].length
+    for register in registers[1:]:
+        if register.register == prev_start:
+            # registers at the same address are different views on the same value
+            prev_end = max(prev_end, register.register + register.length)
+            continue
+
+        if prev_end > register.register:
+            raise ValueError(
+                f"Requested registers must be in monotonically increasing order, "
+                f"but {prev_start} ends at {prev_end} > {register.register}!",
+            )
+
+        # the total span of a read is left to the caller, this only rejects reads of mostly unused registers
+        if register.register - prev_end > MAX_BATCHED_REGISTERS_COUNT:
+            raise ValueError(
+                "Gap between requested registers is too large. Split it in two requests",
+            )
+
+        prev_start, prev_end = register.register, register.register + register.length
+
+    total_length = prev_end - start
+
+    # registers are 16-bit, so the byte offset of each register is twice its distance to the first one
+    return _ReadPlan(
+        start,
+        total_length,
+        tuple((register, (register.register - start) * 2) for register in registers),
+        struct.Struct(f">{total_length}H"),
+    )
+
+
 @dataclass(frozen=True)
 class DeviceInfo:
     """Device information."""
@@ -237,13 +300,14 @@ class AsyncHuaweiSolar:
         self._client.close()
         await self._client.connect()
 
-    async def _decode_response(
-        self,
+    @staticmethod
+    def _decode_response(
         reg: RegisterDefinition,
-        decoder: BinaryPayloadDecoder,
+        payload: bytes,
+        offset: int,
     ):
         """Decode a modbus register and puts it into a Result object."""
-        result = reg.decode(decoder)
+        result = reg.decode_from(payload, offset)
 
         if not hasattr(reg, "unit") or callable(reg.unit) or isinstance(reg.unit, dict):
             return Result(result, None)
@@ -259,59 +323,12 @@ class AsyncHuaweiSolar:
         This is only possible if the registers are consecutively available in the
         inverters' memory.
         """
-        if len(names) == 0:
-            raise ValueError("Expected at least one register name")
-
-        registers = list(map(REGISTERS.get, names))
-
-        if None in registers:
-            missing_registers = set(names) - set(REGISTERS.keys())
-            if missing_registers:
-                raise ValueError(f"Did not recognize register names: {', '.join(missing_registers)}")
-            raise ValueError("Did not recognize all register names")
-        registers = t.cast(list[RegisterDefinition], registers)
-
-        for register, register_name in zip(registers, names, strict=False):
-            if not register.readable:
-                raise ValueError(f"Trying to read unreadable register {register_name}")
-
-        for idx in range(1, len(names)):
-            if registers[idx - 1].register + registers[idx - 1].length > registers[idx].register:
-                raise ValueError(
-                    f"Requested registers must be in monotonically increasing order, "
-                    f"but {registers[idx-1].register} + {registers[idx-1].length} > {registers[idx].register}!",
-                )
-
-            register_distance = registers[idx - 1].register + registers[idx - 1].length - registers[idx].register
-
-            if register_distance > MAX_BATCHED_REGISTERS_COUNT:
-                raise ValueError(
-                    "Gap between requested registers is too large. Split it in two requests",
-                )
-
-        total_length = registers[-1].register + registers[-1].length - registers[0].register
-
-        response = await self._read_registers(
-            registers[0].register,
-            total_length,
-            slave,
-        )
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            response.registers,
-            byteorder=Endian.BIG,
-            wordorder=Endian.BIG,
-        )
+        plan = _plan_read(tuple(names))
 
-        result = [await self._decode_response(registers[0], decoder)]
-        for idx in range(1, len(registers)):
-            skip_registers = registers[idx].register - (registers[idx - 1].register + registers[idx - 1].length)
-            decoder.skip_bytes(
-                skip_registers * 2,
-            )  # registers are 16-bit, so we need to multiply by two
-            result.append(await self._decode_response(registers[idx], decoder))
+        response = await self._read_registers(plan.start, plan.length, slave)
 
-        return result
+        payload = plan.payload.pack(*response.registers)
+        return [self._decode_response(reg, payload, offset) for reg, offset in plan.registers]
 
     async def _read_registers(  # noqa: C901
         self,
@@ -588,7 +605,7 @@ class AsyncHuaweiSolar:
 
             # Request the data in 'frames'
 
-            file_data = b""
+            file_data = bytearray()
             next_frame_no = 0
 
             while (next_frame_no * data_frame_length) < file_length:
@@ -620,7 +637,7 @@ class AsyncHuaweiSolar:
                     f"does not match expected value {swapped_crc}",
                 )
 
-            return file_data
+            return bytes(file_data)
 
         async with self._communication_lock():
             LOGGER.debug(
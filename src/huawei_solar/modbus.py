@@ -4,6 +4,7 @@
 
 import asyncio
 import logging
+import socket
 import struct
 from typing import TYPE_CHECKING, TypedDict
 
@@ -12,6 +13,9 @@ from pymodbus.pdu import ExceptionResponse, ModbusRequest, ModbusResponse
 
 RECONNECT_DELAY = 1000  # in milliseconds
 WAIT_ON_CONNECT = 1500  # in milliseconds
+TCP_KEEPALIVE_IDLE = 30  # in seconds
+TCP_KEEPALIVE_INTERVAL = 10  # in seconds
+TCP_KEEPALIVE_COUNT = 3
 
 LOGGER = logging.getLogger(__name__)
 
@@ -77,6 +81,19 @@ class AsyncHuaweiSolarModbusTcpClient(ModbusConnectionMixin, AsyncModbusTcpClien
         """Create AsyncHuaweiSolarModbusTcpClient."""
         super().__init__(host, port, timeout=timeout, reconnect_delay=RECONNECT_DELAY)
 
+    def connection_made(self, transport):
+        """Enable TCP keep-alive, so that a dropped connection is detected while idling between polls."""
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+        super().connection_made(transport)
+
 
 class PrivateHuaweiModbusResponse(ModbusResponse):
     """Response with the private Huawei Solar function code."""
@@ -2,19 +2,24 @@
 
 # pyright: reportIncompatibleMethodOverride=false
 
-from collections.abc import Callable
+import struct
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Flag, IntEnum, auto
+from enum import Enum, Flag, IntEnum, auto
 from functools import partial
 from inspect import isclass
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar, cast
 
+from pymodbus.constants import Endian
 from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
 from typing_extensions import override
 
 import huawei_solar.register_names as rn
 import huawei_solar.register_values as rv
+from huawei_solar.const import MAX_NUMBER_OF_PV_STRINGS
 from huawei_solar.exceptions import (
     DecodeError,
     PeakPeriodsValidationError,
@@ -39,7 +44,7 @@ class TargetDevice(Flag):
 class RegisterDefinition(Generic[T]):
     """Base class for register definitions."""
 
-    unit: UnitType = None
+    __slots__ = ("length", "readable", "register", "target_device", "unit", "writeable")
 
     def __init__(
         self,
@@ -55,6 +60,7 @@ class RegisterDefinition(Generic[T]):
         self.writeable = writeable
         self.readable = readable
         self.target_device = target_device
+        self.unit: UnitType = None
 
     def encode(self, data: T, builder: BinaryPayloadBuilder):
         """Encode register to bytes."""
@@ -64,24 +70,146 @@ class RegisterDefinition(Generic[T]):
         """Decode register to value."""
         raise NotImplementedError
 
+    def decode_from(self, payload: bytes, offset: int) -> T:
+        """Decode register to value, starting at the given byte offset in the payload."""
+        return self.decode(
+            BinaryPayloadDecoder(
+                payload[offset : offset + self.length * 2],
+                byteorder=Endian.BIG,
+                wordorder=Endian.BIG,
+            ),
+        )
+
 
 class StringRegister(RegisterDefinition[str]):
     """A string register."""
 
+    __slots__ = ()
+
     def decode(self, decoder: BinaryPayloadDecoder):
         """Decode string register."""
-        str_bytes = cast(bytes, decoder.decode_string(self.length * 2))
+        return self._decode_bytes(cast(bytes, decoder.decode_string(self.length * 2)))
+
+    @override
+    def decode_from(self, payload: bytes, offset: int) -> str:
+        return self._decode_bytes(payload[offset : offset + self.length * 2])
+
+    @staticmethod
+    def _decode_bytes(str_bytes: bytes) -> str:
         try:
-            result = str_bytes.decode("utf-8")
+            # strip the NUL padding before decoding, so that it doesn't need to be decoded as well
+            result = str_bytes.rstrip(b"\0").decode("utf-8")
         except UnicodeDecodeError as err:
             raise DecodeError from err
         else:
-            return result.rstrip("\0")
+            return result
+
+
+# Number registers are always decoded from big-endian words in big-endian word order
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_INT16 = struct.Struct(">h")
+_INT32 = struct.Struct(">i")
+_INT64 = struct.Struct(">q")
+
+# the struct that decode_from uses for each typed BinaryPayloadDecoder method
+_DECODER_STRUCTS: Mapping[str, struct.Struct] = MappingProxyType(
+    {
+        "decode_8bit_uint": struct.Struct(">B"),
+        "decode_8bit_int": struct.Struct(">b"),
+        "decode_16bit_uint": _UINT16,
+        "decode_16bit_int": _INT16,
+        "decode_16bit_float": struct.Struct(">e"),
+        "decode_32bit_uint": _UINT32,
+        "decode_32bit_int": _INT32,
+        "decode_32bit_float": struct.Struct(">f"),
+        "decode_64bit_uint": _UINT64,
+        "decode_64bit_int": _INT64,
+        "decode_64bit_float": struct.Struct(">d"),
+    },
+)
+
+
+def _make_number_converter(  # noqa: C901
+    gain: int,
+    invalid_value: int | None,
+    unit: UnitType,
+) -> Callable[[int], Any]:
+    """Create a function that converts a raw number into the value of a number register.
+
+    It is specialized for the configuration of the register, which avoids having to
+    inspect the unit and gain each time a register value is decoded.
+    """
+    if isclass(unit) and issubclass(unit, Enum):
+        assert gain == 1
+        enum_class = unit
+        # look up known members directly, instead of going through the much slower Enum.__call__
+        members = enum_class._value2member_map_
+
+        def convert_to_enum(result: int) -> Any:
+            if result == invalid_value:
+                return None
+            member = members.get(result)
+            if member is not None:
+                return member
+            try:
+                return enum_class(result)
+            except ValueError as err:
+                raise DecodeError from err
+
+        return convert_to_enum
+
+    if callable(unit):
+        assert gain == 1
+        convert = unit
+
+        def convert_with_function(result: int) -> Any:
+            if result == invalid_value:
+                return None
+            try:
+                return convert(result)
+            except ValueError as err:
+                raise DecodeError from err
+
+        return convert_with_function
+
+    if isinstance(unit, dict):
+        assert gain == 1
+        mapping = unit
+
+        def convert_with_mapping(result: int) -> Any:
+            if result == invalid_value:
+                return None
+            try:
+                return mapping[result]
+            except KeyError as err:
+                raise DecodeError from err
+
+        return convert_with_mapping
+
+    if gain != 1:
+
+        def convert_with_gain(result: int) -> float | None:
+            if result == invalid_value:
+                return None
+            return result / gain
+
+        return convert_with_gain
+
+    def convert_plain(result: int) -> int | None:
+        if result == invalid_value:
+            return None
+        return result
+
+    return convert_plain
 
 
 class NumberRegister(RegisterDefinition[T], Generic[T]):
     """Base class for number registers."""
 
+    __slots__ = ("_convert", "_decode_fn", "_encode_fn", "_invalid_value", "_value_struct", "gain")
+
     def __init__(  # noqa: PLR0913
         self,
         unit: str | Callable[[int], T] | dict[int, T] | None,
@@ -103,36 +231,30 @@ class NumberRegister(RegisterDefinition[T], Generic[T]):
             readable,
             target_device=target_device,
         )
-        self.unit = unit
+        # units are shared by many registers, so make sure they all refer to the same string object
+        self.unit = sys.intern(unit) if isinstance(unit, str) else unit
         self.gain = gain
 
-        self._decode_function_name = decode_function_name
-        self._encode_function_name = encode_function_name
+        self._decode_fn: Callable[[BinaryPayloadDecoder], int] = getattr(BinaryPayloadDecoder, decode_function_name)
+        self._value_struct = _DECODER_STRUCTS[decode_function_name]
+        self._encode_fn: Callable[[BinaryPayloadBuilder, int], None] = getattr(
+            BinaryPayloadBuilder,
+            encode_function_name,
+        )
         self._invalid_value = invalid_value
+        self._convert = _make_number_converter(gain, invalid_value, unit)
 
     def decode(self, decoder: BinaryPayloadDecoder) -> T | None:
         """Decode number register."""
-        result = cast(int, getattr(decoder, self._decode_function_name)())
-
-        if self._invalid_value is not None and result == self._invalid_value:
-            return None
+        return self.postprocess(self._decode_fn(decoder))
 
-        if callable(self.unit):
-            assert self.gain == 1
-            try:
-                result = cast(T, self.unit(result))
-            except ValueError as err:
-                raise DecodeError from err
-        elif isinstance(self.unit, dict):
-            assert self.gain == 1
-            try:
-                result = cast(T, self.unit[result])
-            except KeyError as err:
-                raise DecodeError from err
+    @override
+    def decode_from(self, payload: bytes, offset: int) -> T | None:
+        return self.postprocess(self._value_struct.unpack_from(payload, offset)[0])
 
-        if self.gain != 1:
-            result /= self.gain
-        return result  # ignore: return-value
+    def postprocess(self, value: int) -> T | None:
+        """Convert the raw number into the value of the register."""
+        return self._convert(value)
 
     def encode(self, data: T, builder: BinaryPayloadBuilder):
         """Encode number register."""
@@ -155,12 +277,14 @@ class NumberRegister(RegisterDefinition[T], Generic[T]):
         else:
             raise WriteException(f"Unsupported type: {type(data)}.")
 
-        getattr(builder, self._encode_function_name)(int_data)
+        self._encode_fn(builder, int_data)
 
 
 class U16Register(NumberRegister[T], Generic[T]):
     """Unsigned 16-bit register."""
 
+    __slots__ = ()
+
     def __init__(  # noqa: PLR0913
         self,
         unit,
@@ -189,6 +313,8 @@ class U16Register(NumberRegister[T], Generic[T]):
 class U32Register(NumberRegister[T], Generic[T]):
     """Unsigned 32-bit register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -214,6 +340,8 @@ class U32Register(NumberRegister[T], Generic[T]):
 class U64Register(NumberRegister[T], Generic[T]):
     """Unsigned 64-bit register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -239,6 +367,8 @@ class U64Register(NumberRegister[T], Generic[T]):
 class I16Register(NumberRegister[T], Generic[T]):
     """Signed 16-bit register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -264,6 +394,8 @@ class I16Register(NumberRegister[T], Generic[T]):
 class I32Register(NumberRegister[T], Generic[T]):
     """Signed 32-bit register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -289,6 +421,8 @@ class I32Register(NumberRegister[T], Generic[T]):
 class I64Register(NumberRegister[T], Generic[T]):
     """Signed 64-bit register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -320,8 +454,14 @@ class I32AbsoluteValueRegister(NumberRegister[T], Generic[T]):
 
     cfr. https://github.com/wlcrs/huawei_solar/issues/54
 
+    The value must be decoded as a signed number before taking its absolute
+     value: negative values are sent in two's complement, so masking off the
+     sign bit of the raw value would not yield its magnitude.
+
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         unit,
@@ -343,27 +483,51 @@ class I32AbsoluteValueRegister(NumberRegister[T], Generic[T]):
             target_device=target_device,
         )
 
-    def decode(self, decoder: BinaryPayloadDecoder):
-        """Decode 32-bit signed integer into absolute value."""
-        value = super().decode(decoder)
-        return abs(value) if value is not None else None
+    @override
+    def postprocess(self, value: int) -> T | None:
+        """Convert 32-bit signed integer into absolute value."""
+        result = super().postprocess(value)
+        return abs(result) if result is not None else None  # type: ignore[arg-type]
+
 
+def _bitfield_table(definition: dict[int, Any]) -> tuple[tuple[int, Any, Any], ...]:
+    """Flatten a bitfield definition into (mask, on value, off value) tuples."""
+    return tuple(
+        (mask, value.on_value, value.off_value) if isinstance(value, rv.OnOffBit) else (mask, value, None)
+        for mask, value in definition.items()
+    )
 
-def bitfield_decoder(definition, bitfield):
+
+def _decode_bitfield_table(table: tuple[tuple[int, Any, Any], ...], bitfield: int) -> list:
+    """Decode a bitfield into a list of statuses, using a table built by _bitfield_table."""
+    return [
+        on_value if mask & bitfield else off_value
+        for mask, on_value, off_value in table
+        if mask & bitfield or off_value is not None
+    ]
+
+
+def bitfield_decoder(definition: dict[int, Any], bitfield: int) -> list:
     """Decode a bitfield into a list of statuses."""
-    result = []
-    for key, value in definition.items():
-        if isinstance(value, rv.OnOffBit):
-            result.append(value.on_value if key & bitfield else value.off_value)
-        elif key & bitfield:
-            result.append(value)
+    return _decode_bitfield_table(_bitfield_table(definition), bitfield)
+
 
+def flag_decoder(flags: dict[int, Any], bitfield: int) -> list:
+    """Decode a bitfield of single-bit flags, only visiting the bits that are set."""
+    result = []
+    while bitfield:
+        bit = bitfield & -bitfield
+        if bit in flags:
+            result.append(flags[bit])
+        bitfield ^= bit
     return result
 
 
 class TimestampRegister(U32Register[datetime]):
     """Timestamp register."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         register,
@@ -379,14 +543,15 @@ class TimestampRegister(U32Register[datetime]):
             target_device=target_device,
         )
 
-    def decode(self, decoder: BinaryPayloadDecoder):
-        """Decode timestamp register."""
-        value = super().decode(decoder)
-        if value is None:
+    @override
+    def postprocess(self, value: int):
+        """Convert timestamp register."""
+        result = super().postprocess(value)
+        if result is None:
             return None
 
-        assert isinstance(value, int)
-        return datetime.fromtimestamp(value)
+        assert isinstance(result, int)
+        return datetime.fromtimestamp(result)
         # if inverter.time_zone:
         #     value = value - 60 * inverter.time_zone
 
@@ -404,7 +569,7 @@ class TimestampRegister(U32Register[datetime]):
         #     raise DecodeError(f"Received invalid timestamp {value}") from err
 
 
-@dataclass
+@dataclass(slots=True)
 class LG_RESU_TimeOfUsePeriod:
     """Time of use period of LG RESU."""
 
@@ -420,7 +585,7 @@ class ChargeFlag(IntEnum):
     DISCHARGE = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class HUAWEI_LUNA2000_TimeOfUsePeriod:
     """Time of use period of Huawei LUNA2000."""
 
@@ -439,23 +604,38 @@ class HUAWEI_LUNA2000_TimeOfUsePeriod:
 
 
 LG_RESU_TOU_PERIODS = 10
+_LG_RESU_TOU_PERIOD = struct.Struct(">HHI")  # start time, end time, electricity price
 
 
 class LG_RESU_TimeOfUseRegisters(RegisterDefinition[list[LG_RESU_TimeOfUsePeriod]]):
     """Time of use register."""
 
+    __slots__ = ()
+
     def decode(self, decoder: BinaryPayloadDecoder):
         """Decode time of use register."""
         number_of_periods = decoder.decode_16bit_uint()
+        return self._decode_periods(
+            number_of_periods,
+            decoder.decode_string(_LG_RESU_TOU_PERIOD.size * LG_RESU_TOU_PERIODS),
+        )
+
+    @override
+    def decode_from(self, payload: bytes, offset: int):
+        number_of_periods = _UINT16.unpack_from(payload, offset)[0]
+        offset += _UINT16.size
+        return self._decode_periods(
+            number_of_periods,
+            payload[offset : offset + _LG_RESU_TOU_PERIOD.size * LG_RESU_TOU_PERIODS],
+        )
+
+    @staticmethod
+    def _decode_periods(number_of_periods: int, data: bytes) -> list[LG_RESU_TimeOfUsePeriod]:
         assert number_of_periods <= LG_RESU_TOU_PERIODS
 
         periods = [
-            LG_RESU_TimeOfUsePeriod(
-                decoder.decode_16bit_uint(),
-                decoder.decode_16bit_uint(),
-                decoder.decode_32bit_uint() / 1000,
-            )
-            for _ in range(LG_RESU_TOU_PERIODS)
+            LG_RESU_TimeOfUsePeriod(start_time, end_time, electricity_price / 1000)
+            for start_time, end_time, electricity_price in _LG_RESU_TOU_PERIOD.iter_unpack(data)
         ]
 
         return periods[:number_of_periods]
@@ -521,31 +701,62 @@ class LG_RESU_TimeOfUseRegisters(RegisterDefinition[list[LG_RESU_TimeOfUsePeriod
 HUAWEI_LUNA2000_TOU_PERIODS = 14
 
 
+def _days_effective_builder(days_tuple):
+    result = 0
+    mask = 0x1
+    for i in range(7):
+        if days_tuple[i]:
+            result += mask
+        mask = mask << 1
+
+    return result
+
+
+# days effective tuple for every possible 7-bit value
+_DAYS_EFFECTIVE = tuple(tuple((value >> day) & 1 == 1 for day in range(7)) for value in range(128))
+
+
+def _days_effective_parser(value):
+    return _DAYS_EFFECTIVE[value & 0x7F]
+
+
+_HUAWEI_LUNA2000_TOU_PERIOD = struct.Struct(">HHBB")  # start time, end time, charge flag, days effective
+
+
 class HUAWEI_LUNA2000_TimeOfUseRegisters(RegisterDefinition[list[HUAWEI_LUNA2000_TimeOfUsePeriod]]):
     """Time of use register."""
 
+    __slots__ = ()
+
     def decode(self, decoder: BinaryPayloadDecoder):
         """Decode time of use register."""
         number_of_periods = decoder.decode_16bit_uint()
-        assert number_of_periods <= HUAWEI_LUNA2000_TOU_PERIODS
+        return self._decode_periods(
+            number_of_periods,
+            decoder.decode_string(_HUAWEI_LUNA2000_TOU_PERIOD.size * HUAWEI_LUNA2000_TOU_PERIODS),
+        )
 
-        def _days_effective_parser(value):
-            result = []
-            mask = 0x1
-            for _ in range(7):
-                result.append((value & mask) != 0)
-                mask = mask << 1
+    @override
+    def decode_from(self, payload: bytes, offset: int):
+        number_of_periods = _UINT16.unpack_from(payload, offset)[0]
+        offset += _UINT16.size
+        return self._decode_periods(
+            number_of_periods,
+            payload[offset : offset + _HUAWEI_LUNA2000_TOU_PERIOD.size * HUAWEI_LUNA2000_TOU_PERIODS],
+        )
 
-            return tuple(result)
+    @staticmethod
+    def _decode_periods(number_of_periods: int, data: bytes) -> list[HUAWEI_LUNA2000_TimeOfUsePeriod]:
+        assert number_of_periods <= HUAWEI_LUNA2000_TOU_PERIODS
 
         periods = [
             HUAWEI_LUNA2000_TimeOfUsePeriod(
-                decoder.decode_16bit_uint(),
-                decoder.decode_16bit_uint(),
-                ChargeFlag(decoder.decode_8bit_uint()),
-                _days_effective_parser(decoder.decode_8bit_uint()),
+                start_time,
+                end_time,
+                ChargeFlag(charge_flag),
+                _days_effective_parser(days_effective),
             )
-            for _ in range(HUAWEI_LUNA2000_TOU_PERIODS)
+            for start_time, end_time, charge_flag, days_effective in _HUAWEI_LUNA2000_TOU_PERIOD.iter_unpack(data)
         ]
 
         return periods[:number_of_periods]
@@ -573,13 +784,12 @@ class HUAWEI_LUNA2000_TimeOfUseRegisters(RegisterDefinition[list[HUAWEI_LUNA2000
                     "TOU period is invalid (start-time is greater than end-time)",
                 )
 
+        # sort once, filtering per day keeps the order
+        sorted_periods = sorted(data, key=lambda a: a.start_time)
+
         for day_idx in range(7):
             # find all ranges that are valid for the given day
-            active_periods: list[HUAWEI_LUNA2000_TimeOfUsePeriod] = list(
-                filter(lambda period: period.days_effective[day_idx], data),
-            )
-
-            active_periods.sort(key=lambda a: a.start_time)
+            active_periods = [period for period in sorted_periods if period.days_effective[day_idx]]
 
             for period_idx in range(1, len(active_periods)):
                 current_period = active_periods[period_idx]
@@ -601,16 +811,6 @@ class HUAWEI_LUNA2000_TimeOfUseRegisters(RegisterDefinition[list[HUAWEI_LUNA2000
         assert len(data) <= HUAWEI_LUNA2000_TOU_PERIODS
         builder.add_16bit_uint(len(data))
 
-        def _days_effective_builder(days_tuple):
-            result = 0
-            mask = 0x1
-            for i in range(7):
-                if days_tuple[i]:
-                    result += mask
-                mask = mask << 1
-
-            return result
-
         for period in data:
             builder.add_16bit_uint(period.start_time)
             builder.add_16bit_uint(period.end_time)
@@ -624,7 +824,7 @@ class HUAWEI_LUNA2000_TimeOfUseRegisters(RegisterDefinition[list[HUAWEI_LUNA2000
             builder.add_16bit_uint(0)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChargeDischargePeriod:
     """Charge or Discharge Period."""
 
@@ -634,24 +834,39 @@ class ChargeDischargePeriod:
 
 
 CHARGE_DISCHARGE_PERIODS = 10
+_CHARGE_DISCHARGE_PERIOD = struct.Struct(">HHi")  # start time, end time, power
 
 
 class ChargeDischargePeriodRegisters(RegisterDefinition[list[ChargeDischargePeriod]]):
     """Charge or discharge period registers."""
 
+    __slots__ = ()
+
     @override
     def decode(self, decoder: BinaryPayloadDecoder) -> list[ChargeDischargePeriod]:
         """Decode ChargeDischargePeriodRegisters."""
         number_of_periods = decoder.decode_16bit_uint()
+        return self._decode_periods(
+            number_of_periods,
+            decoder.decode_string(_CHARGE_DISCHARGE_PERIOD.size * CHARGE_DISCHARGE_PERIODS),
+        )
+
+    @override
+    def decode_from(self, payload: bytes, offset: int) -> list[ChargeDischargePeriod]:
+        number_of_periods = _UINT16.unpack_from(payload, offset)[0]
+        offset += _UINT16.size
+        return self._decode_periods(
+            number_of_periods,
+            payload[offset : offset + _CHARGE_DISCHARGE_PERIOD.size * CHARGE_DISCHARGE_PERIODS],
+        )
+
+    @staticmethod
+    def _decode_periods(number_of_periods: int, data: bytes) -> list[ChargeDischargePeriod]:
         assert number_of_periods <= CHARGE_DISCHARGE_PERIODS
 
         periods = [
-            ChargeDischargePeriod(
-                decoder.decode_16bit_uint(),
-                decoder.decode_16bit_uint(),
-                decoder.decode_32bit_int(),
-            )
-            for _ in range(10)
+            ChargeDischargePeriod(start_time, end_time, power)
+            for start_time, end_time, power in _CHARGE_DISCHARGE_PERIOD.iter_unpack(data)
         ]
 
         return periods[:number_of_periods]
@@ -673,7 +888,7 @@ class ChargeDischargePeriodRegisters(RegisterDefinition[list[ChargeDischargePeri
             builder.add_32bit_uint(0)
 
 
-@dataclass
+@dataclass(slots=True)
 class PeakSettingPeriod:
     """Peak Setting Period."""
 
@@ -692,48 +907,37 @@ class PeakSettingPeriod:
 
 
 PEAK_SETTING_PERIODS = 14
-
-
-def _days_effective_builder(days_tuple):
-    result = 0
-    mask = 0x1
-    for i in range(7):
-        if days_tuple[i]:
-            result += mask
-        mask = mask << 1
-
-    return result
-
-
-def _days_effective_parser(value):
-    result = []
-    mask = 0x1
-    for _ in range(7):
-        result.append((value & mask) != 0)
-        mask = mask << 1
-
-    return tuple(result)
+_PEAK_SETTING_PERIOD = struct.Struct(">HHiB")  # start time, end time, power, days effective
 
 
 class PeakSettingPeriodRegisters(RegisterDefinition[list[PeakSettingPeriod]]):
     """Peak Setting Period registers."""
 
+    __slots__ = ()
+
     def decode(self, decoder: BinaryPayloadDecoder) -> list[PeakSettingPeriod]:
         """Decode PeakSettingPeriodRegisters."""
-        number_of_periods = decoder.decode_16bit_uint()
+        # Safety check
+        number_of_periods = min(decoder.decode_16bit_uint(), PEAK_SETTING_PERIODS)
+        return self._decode_periods(
+            number_of_periods,
+            decoder.decode_string(_PEAK_SETTING_PERIOD.size * number_of_periods),
+        )
 
+    @override
+    def decode_from(self, payload: bytes, offset: int) -> list[PeakSettingPeriod]:
         # Safety check
-        number_of_periods = min(number_of_periods, PEAK_SETTING_PERIODS)
+        number_of_periods = min(_UINT16.unpack_from(payload, offset)[0], PEAK_SETTING_PERIODS)
+        offset += _UINT16.size
+        return self._decode_periods(
+            number_of_periods,
+            payload[offset : offset + _PEAK_SETTING_PERIOD.size * number_of_periods],
+        )
 
+    @staticmethod
+    def _decode_periods(number_of_periods: int, data: bytes) -> list[PeakSettingPeriod]:
         periods = []
-        for _ in range(number_of_periods):
-            start_time, end_time, peak_value, week_value = (
-                decoder.decode_16bit_uint(),
-                decoder.decode_16bit_uint(),
-                decoder.decode_32bit_int(),
-                decoder.decode_8bit_uint(),
-            )
-
+        for start_time, end_time, peak_value, week_value in _PEAK_SETTING_PERIOD.iter_unpack(data):
             if start_time != end_time and week_value != 0:
                 periods.append(
                     PeakSettingPeriod(
@@ -747,11 +951,12 @@ class PeakSettingPeriodRegisters(RegisterDefinition[list[PeakSettingPeriod]]):
         return periods[:number_of_periods]
 
     def _validate(self, data: list[PeakSettingPeriod]):
+        # sort once, filtering per day keeps the order
+        sorted_periods = sorted(data, key=lambda a: a.start_time)
+
         for day_idx in range(7):
             # find all ranges that are valid for the given day
-            active_periods: list[PeakSettingPeriod] = list(
-                filter(lambda period: period.days_effective[day_idx], data),
-            )
+            active_periods = [period for period in sorted_periods if period.days_effective[day_idx]]
 
             if not len(active_periods):
                 raise PeakPeriodsValidationError(
@@ -759,8 +964,6 @@ class PeakSettingPeriodRegisters(RegisterDefinition[list[PeakSettingPeriod]]):
                 )
 
             # require full day to be covered
-            active_periods.sort(key=lambda a: a.start_time)
-
             if active_periods[0].start_time != 0:
                 raise PeakPeriodsValidationError("Every day must be covered from 00:00")
 
@@ -801,7 +1004,7 @@ class PeakSettingPeriodRegisters(RegisterDefinition[list[PeakSettingPeriod]]):
             builder.add_8bit_uint(0)
 
 
-REGISTERS: dict[str, RegisterDefinition] = {
+_REGISTERS: dict[str, RegisterDefinition] = {
     rn.MODEL_NAME: StringRegister(30000, 15, target_device=TargetDevice.SUN2000 | TargetDevice.EMMA),
     rn.SERIAL_NUMBER: StringRegister(
         30015,
@@ -852,22 +1055,22 @@ REGISTERS: dict[str, RegisterDefinition] = {
     rn.EL_MODULE_VERSION: StringRegister(31130, 15),
     rn.AFCI_2_VERSION: StringRegister(31145, 15),
     rn.REGKEY: StringRegister(31200, 10),
-    rn.STATE_1: U16Register(partial(bitfield_decoder, rv.STATE_CODES_1), 1, 32000),
-    rn.STATE_2: U16Register(partial(bitfield_decoder, rv.STATE_CODES_2), 1, 32002),
-    rn.STATE_3: U32Register(partial(bitfield_decoder, rv.STATE_CODES_3), 1, 32003),
+    rn.STATE_1: U16Register(partial(flag_decoder, rv.STATE_CODES_1), 1, 32000),
+    rn.STATE_2: U16Register(partial(_decode_bitfield_table, _bitfield_table(rv.STATE_CODES_2)), 1, 32002),
+    rn.STATE_3: U32Register(partial(_decode_bitfield_table, _bitfield_table(rv.STATE_CODES_3)), 1, 32003),
     rn.ALARM_1: U16Register(
-        partial(bitfield_decoder, rv.ALARM_CODES_1),
+        partial(flag_decoder, rv.ALARM_CODES_1),
         1,
         32008,
         ignore_invalid=True,
     ),
     rn.ALARM_2: U16Register(
-        partial(bitfield_decoder, rv.ALARM_CODES_2),
+        partial(flag_decoder, rv.ALARM_CODES_2),
         1,
         32009,
         ignore_invalid=True,
     ),
-    rn.ALARM_3: U16Register(partial(bitfield_decoder, rv.ALARM_CODES_3), 1, 32010),
+    rn.ALARM_3: U16Register(partial(flag_decoder, rv.ALARM_CODES_3), 1, 32010),
     rn.INPUT_POWER: I32Register("W", 1, 32064),
     rn.GRID_VOLTAGE: U16Register("V", 10, 32066),
     rn.LINE_VOLTAGE_A_B: U16Register("V", 10, 32066),
@@ -1040,60 +1243,48 @@ REGISTERS: dict[str, RegisterDefinition] = {
 }
 
 
-PV_REGISTERS = {
-    rn.PV_01_VOLTAGE: I16Register("V", 10, 32016),
-    rn.PV_01_CURRENT: I16Register("A", 100, 32017),
-    rn.PV_02_VOLTAGE: I16Register("V", 10, 32018),
-    rn.PV_02_CURRENT: I16Register("A", 100, 32019),
-    rn.PV_03_VOLTAGE: I16Register("V", 10, 32020),
-    rn.PV_03_CURRENT: I16Register("A", 100, 32021),
-    rn.PV_04_VOLTAGE: I16Register("V", 10, 32022),
-    rn.PV_04_CURRENT: I16Register("A", 100, 32023),
-    rn.PV_05_VOLTAGE: I16Register("V", 10, 32024),
-    rn.PV_05_CURRENT: I16Register("A", 100, 32025),
-    rn.PV_06_VOLTAGE: I16Register("V", 10, 32026),
-    rn.PV_06_CURRENT: I16Register("A", 100, 32027),
-    rn.PV_07_VOLTAGE: I16Register("V", 10, 32028),
-    rn.PV_07_CURRENT: I16Register("A", 100, 32029),
-    rn.PV_08_VOLTAGE: I16Register("V", 10, 32030),
-    rn.PV_08_CURRENT: I16Register("A", 100, 32031),
-    rn.PV_09_VOLTAGE: I16Register("V", 10, 32032),
-    rn.PV_09_CURRENT: I16Register("A", 100, 32033),
-    rn.PV_10_VOLTAGE: I16Register("V", 10, 32034),
-    rn.PV_10_CURRENT: I16Register("A", 100, 32035),
-    rn.PV_11_VOLTAGE: I16Register("V", 10, 32036),
-    rn.PV_11_CURRENT: I16Register("A", 100, 32037),
-    rn.PV_12_VOLTAGE: I16Register("V", 10, 32038),
-    rn.PV_12_CURRENT: I16Register("A", 100, 32039),
-    rn.PV_13_VOLTAGE: I16Register("V", 10, 32040),
-    rn.PV_13_CURRENT: I16Register("A", 100, 32041),
-    rn.PV_14_VOLTAGE: I16Register("V", 10, 32042),
-    rn.PV_14_CURRENT: I16Register("A", 100, 32043),
-    rn.PV_15_VOLTAGE: I16Register("V", 10, 32044),
-    rn.PV_15_CURRENT: I16Register("A", 100, 32045),
-    rn.PV_16_VOLTAGE: I16Register("V", 10, 32046),
-    rn.PV_16_CURRENT: I16Register("A", 100, 32047),
-    rn.PV_17_VOLTAGE: I16Register("V", 10, 32048),
-    rn.PV_17_CURRENT: I16Register("A", 100, 32049),
-    rn.PV_18_VOLTAGE: I16Register("V", 10, 32050),
-    rn.PV_18_CURRENT: I16Register("A", 100, 32051),
-    rn.PV_19_VOLTAGE: I16Register("V", 10, 32052),
-    rn.PV_19_CURRENT: I16Register("A", 100, 32053),
-    rn.PV_20_VOLTAGE: I16Register("V", 10, 32054),
-    rn.PV_20_CURRENT: I16Register("A", 100, 32055),
-    rn.PV_21_VOLTAGE: I16Register("V", 10, 32056),
-    rn.PV_21_CURRENT: I16Register("A", 100, 32057),
-    rn.PV_22_VOLTAGE: I16Register("V", 10, 32058),
-    rn.PV_22_CURRENT: I16Register("A", 100, 32059),
-    rn.PV_23_VOLTAGE: I16Register("V", 10, 32060),
-    rn.PV_23_CURRENT: I16Register("A", 100, 32061),
-    rn.PV_24_VOLTAGE: I16Register("V", 10, 32062),
-    rn.PV_24_CURRENT: I16Register("A", 100, 32063),
-}
+def _pv_string_registers() -> dict[str, RegisterDefinition]:
+    """Create the voltage and current registers of all PV strings."""
+    registers: dict[str, RegisterDefinition] = {}
+    for idx in range(1, MAX_NUMBER_OF_PV_STRINGS + 1):
+        voltage_register = 32016 + 2 * (idx - 1)
+        registers[getattr(rn, f"PV_{idx:02}_VOLTAGE")] = I16Register("V", 10, voltage_register)
+        registers[getattr(rn, f"PV_{idx:02}_CURRENT")] = I16Register("A", 100, voltage_register + 1)
+    return registers
+
+
+_PV_REGISTERS = _pv_string_registers()
+
+_REGISTERS.update(_PV_REGISTERS)
+
+
+def _battery_pack_registers() -> dict[str, RegisterDefinition]:
+    """Create the registers of the battery packs of both storage units."""
+    battery_packs = [(unit, pack) for unit in (1, 2) for pack in (1, 2, 3)]
+
+    registers: dict[str, RegisterDefinition] = {}
+    for idx, (unit, pack) in enumerate(battery_packs):
+        prefix = f"STORAGE_UNIT_{unit}_BATTERY_PACK_{pack}"
+        base = 38200 + 42 * idx
+        registers[getattr(rn, f"{prefix}_SERIAL_NUMBER")] = StringRegister(base, 10)
+        registers[getattr(rn, f"{prefix}_FIRMWARE_VERSION")] = StringRegister(base + 10, 15)
+        registers[getattr(rn, f"{prefix}_WORKING_STATUS")] = U16Register(None, 1, base + 28)
+        registers[getattr(rn, f"{prefix}_STATE_OF_CAPACITY")] = U16Register("%", 10, base + 29)
+        registers[getattr(rn, f"{prefix}_CHARGE_DISCHARGE_POWER")] = I32Register("W", 1, base + 33)
+        registers[getattr(rn, f"{prefix}_VOLTAGE")] = U16Register("V", 10, base + 35)
+        registers[getattr(rn, f"{prefix}_CURRENT")] = I16Register("A", 10, base + 36)
+        registers[getattr(rn, f"{prefix}_TOTAL_CHARGE")] = U32Register("kWh", 100, base + 38)
+        registers[getattr(rn, f"{prefix}_TOTAL_DISCHARGE")] = U32Register("kWh", 100, base + 40)
 
-REGISTERS.update(PV_REGISTERS)
+    for idx, (unit, pack) in enumerate(battery_packs):
+        prefix = f"STORAGE_UNIT_{unit}_BATTERY_PACK_{pack}"
+        registers[getattr(rn, f"{prefix}_MAXIMUM_TEMPERATURE")] = I16Register("°C", 10, 38452 + 2 * idx)
+        registers[getattr(rn, f"{prefix}_MINIMUM_TEMPERATURE")] = I16Register("°C", 10, 38453 + 2 * idx)
 
-BATTERY_REGISTERS = {
+    return registers
+
+
+_BATTERY_REGISTERS = {
     rn.STORAGE_UNIT_1_RUNNING_STATUS: U16Register(rv.StorageStatus, 1, 37000),
     rn.STORAGE_UNIT_1_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 37001),
     rn.STORAGE_UNIT_1_BUS_VOLTAGE: U16Register("V", 10, 37003),
@@ -1145,72 +1336,7 @@ BATTERY_REGISTERS = {
     rn.STORAGE_UNIT_2_BATTERY_PACK_3_SOH_CALIBRATION_STATUS: U16Register(None,1, 37925),
     rn.STORAGE_UNIT_SOH_CALIBRATION_STATUS: U16Register(None,1, 37926),
     rn.STORAGE_UNIT_SOH_CALIBRATION_RELEASE_LOWER_LIMIT_OF_SOC: U16Register(None,1, 37927),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_SERIAL_NUMBER: StringRegister(38200, 10),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_FIRMWARE_VERSION: StringRegister(38210, 15),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_WORKING_STATUS: U16Register(None, 1, 38228),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_STATE_OF_CAPACITY: U16Register("%", 10, 38229),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38233),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_VOLTAGE: U16Register("V", 10, 38235),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_CURRENT: I16Register("A", 10, 38236),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_TOTAL_CHARGE: U32Register("kWh", 100, 38238),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_TOTAL_DISCHARGE: U32Register("kWh", 100, 38240),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_SERIAL_NUMBER: StringRegister(38242, 10),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_FIRMWARE_VERSION: StringRegister(38252, 15),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_WORKING_STATUS: U16Register(None, 1, 38270),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_STATE_OF_CAPACITY: U16Register("%", 10, 38271),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38275),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_VOLTAGE: U16Register("V", 10, 38277),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_CURRENT: I16Register("A", 10, 38278),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_TOTAL_CHARGE: U32Register("kWh", 100, 38280),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_TOTAL_DISCHARGE: U32Register("kWh", 100, 38282),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_SERIAL_NUMBER: StringRegister(38284, 10),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_FIRMWARE_VERSION: StringRegister(38294, 15),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_WORKING_STATUS: U16Register(None, 1, 38312),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_STATE_OF_CAPACITY: U16Register("%", 10, 38313),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38317),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_VOLTAGE: U16Register("V", 10, 38319),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_CURRENT: I16Register("A", 10, 38320),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_TOTAL_CHARGE: U32Register("kWh", 100, 38322),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_TOTAL_DISCHARGE: U32Register("kWh", 100, 38324),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_SERIAL_NUMBER: StringRegister(38326, 10),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_FIRMWARE_VERSION: StringRegister(38336, 15),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_WORKING_STATUS: U16Register(None, 1, 38354),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_STATE_OF_CAPACITY: U16Register("%", 10, 38355),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38359),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_VOLTAGE: U16Register("V", 10, 38361),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_CURRENT: I16Register("A", 10, 38362),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_TOTAL_CHARGE: U32Register("kWh", 100, 38364),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_TOTAL_DISCHARGE: U32Register("kWh", 100, 38366),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_SERIAL_NUMBER: StringRegister(38368, 10),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_FIRMWARE_VERSION: StringRegister(38378, 15),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_WORKING_STATUS: U16Register(None, 1, 38396),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_STATE_OF_CAPACITY: U16Register("%", 10, 38397),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38401),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_VOLTAGE: U16Register("V", 10, 38403),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_CURRENT: I16Register("A", 10, 38404),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_TOTAL_CHARGE: U32Register("kWh", 100, 38406),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_TOTAL_DISCHARGE: U32Register("kWh", 100, 38408),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_SERIAL_NUMBER: StringRegister(38410, 10),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_FIRMWARE_VERSION: StringRegister(38420, 15),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_WORKING_STATUS: U16Register(None, 1, 38438),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_STATE_OF_CAPACITY: U16Register("%", 10, 38439),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_CHARGE_DISCHARGE_POWER: I32Register("W", 1, 38443),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_VOLTAGE: U16Register("V", 10, 38445),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_CURRENT: I16Register("A", 10, 38446),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_TOTAL_CHARGE: U32Register("kWh", 100, 38448),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_TOTAL_DISCHARGE: U32Register("kWh", 100, 38450),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38452),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_1_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38453),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38454),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_2_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38455),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38456),
-    rn.STORAGE_UNIT_1_BATTERY_PACK_3_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38457),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38458),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_1_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38459),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38460),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_2_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38461),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_MAXIMUM_TEMPERATURE: I16Register("°C", 10, 38462),
-    rn.STORAGE_UNIT_2_BATTERY_PACK_3_MINIMUM_TEMPERATURE: I16Register("°C", 10, 38463),
+    **_battery_pack_registers(),
     rn.STORAGE_UNIT_1_PRODUCT_MODEL: U16Register(rv.StorageProductModel, 1, 47000),
     rn.STORAGE_WORKING_MODE_A: I16Register(rv.StorageWorkingModesA, 1, 47004),
     rn.STORAGE_TIME_OF_USE_PRICE: I16Register(bool, 1, 47027),
@@ -1335,9 +1461,9 @@ BATTERY_REGISTERS = {
     rn.STORAGE_UNIT_2_PACK_2_NO: U16Register(None, 1, 47754),
     rn.STORAGE_UNIT_2_PACK_3_NO: U16Register(None, 1, 47755),
 }
-REGISTERS.update(BATTERY_REGISTERS)
+_REGISTERS.update(_BATTERY_REGISTERS)
 
-CAPACITY_CONTROL_REGISTERS = {
+_CAPACITY_CONTROL_REGISTERS = {
     # We must check if we can read from these registers to know if this feature is supported
     # by the inverter/battery firmware
     rn.STORAGE_CAPACITY_CONTROL_MODE: U16Register(
@@ -1359,9 +1485,9 @@ CAPACITY_CONTROL_REGISTERS = {
     ),
 }
 
-REGISTERS.update(CAPACITY_CONTROL_REGISTERS)
+_REGISTERS.update(_CAPACITY_CONTROL_REGISTERS)
 
-EMMA_REGISTERS = {
+_EMMA_REGISTERS = {
     rn.EMMA_SOFTWARE_VERSION: StringRegister(30035, 15, target_device=TargetDevice.EMMA),
     rn.EMMA_MODEL: StringRegister(30222, 20, target_device=TargetDevice.EMMA),
     rn.INVERTER_TOTAL_ABSORBED_ENERGY: U64Register("kWh", 100, 30302, target_device=TargetDevice.EMMA),
@@ -1569,10 +1695,10 @@ EMMA_REGISTERS = {
     ),
 }
 
-REGISTERS.update(EMMA_REGISTERS)
+_REGISTERS.update(_EMMA_REGISTERS)
 
 
-METER_REGISTERS = {
+_METER_REGISTERS = {
     rn.METER_STATUS: U16Register(rv.MeterStatus, 1, 37100),
     rn.GRID_A_VOLTAGE: I32Register("V", 10, 37101),
     rn.GRID_B_VOLTAGE: I32Register("V", 10, 37103),
@@ -1598,9 +1724,9 @@ METER_REGISTERS = {
     rn.METER_TYPE_CHECK: U16Register(rv.MeterTypeCheck, 1, 37138),
 }
 
-REGISTERS.update(METER_REGISTERS)
+_REGISTERS.update(_METER_REGISTERS)
 
-SDONGLE_REGISTERS = {
+_SDONGLE_REGISTERS = {
     rn.SDONGLE_TOTAL_INPUT_POWER: U32Register("W", 1, 37498),
     rn.SDONGLE_LOAD_POWER: U32Register("W", 1, 37500),
     rn.SDONGLE_GRID_POWER: I32Register("W", 1, 37502),  # positive is importing, negative is exporting
@@ -1608,4 +1734,31 @@ SDONGLE_REGISTERS = {
     rn.SDONGLE_TOTAL_ACTIVE_POWER: I32Register("W", 1, 37516),
 }
 
-REGISTERS.update(SDONGLE_REGISTERS)
+_REGISTERS.update(_SDONGLE_REGISTERS)
+
+# The register tables are read-only after they have been constructed
+REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_REGISTERS)
+PV_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_PV_REGISTERS)
+BATTERY_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_BATTERY_REGISTERS)
+CAPACITY_CONTROL_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_CAPACITY_CONTROL_REGISTERS)
+EMMA_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_EMMA_REGISTERS)
+METER_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_METER_REGISTERS)
+SDONGLE_REGISTERS: Mapping[str, RegisterDefinition] = MappingProxyType(_SDONGLE_REGISTERS)
+
+
+def _sort_registers(target_device: TargetDevice) -> tuple[tuple[str, RegisterDefinition], ...]:
+    """Return the registers of a device, sorted by address."""
+    return tuple(
+        sorted(
+            ((name, reg) for name, reg in REGISTERS.items() if target_device in reg.target_device),
+            key=lambda item: item[1].register,
+        ),
+    )
+
+
+_SORTED_REGISTERS = {target_device: _sort_registers(target_device) for target_device in TargetDevice}
+
+
+def registers_for(target_device: TargetDevice) -> tuple[tuple[str, RegisterDefinition], ...]:
+    """Return the (name, register) pairs of all registers of a device, sorted by address."""
+    return _SORTED_REGISTERS[target_device]
@@ -4,6 +4,8 @@ import huawei_solar.register_names as rn
 from huawei_solar.exceptions import PeakPeriodsValidationError
 from huawei_solar.registers import REGISTERS, PeakSettingPeriod
 
+ALL_DAYS = (True,) * 7
+
 ppr = REGISTERS[rn.STORAGE_CAPACITY_CONTROL_PERIODS]
 
 
@@ -13,7 +15,7 @@ def test_simple():
             start_time=0,
             end_time=1440,
             power=2.5,
-            days_effective=[True, True, True, True, True, True, True],
+            days_effective=ALL_DAYS,
         ),
     ]
 
@@ -26,7 +28,7 @@ def test_invalid_start_time():
             start_time=60 * 24 + 1,
             end_time=15,
             power=2.5,
-            days_effective=[True, True, True, True, True, True, True],
+            days_effective=ALL_DAYS,
         ),
     ]
 
@@ -43,7 +45,7 @@ def test_invalid_end_time():
             start_time=0,
             end_time=15,
             power=2.5,
-            days_effective=[True, True, True, True, True, True, True],
+            days_effective=ALL_DAYS,
         ),
     ]
 
@@ -58,7 +60,7 @@ def test_invalid_end_time():
             start_time=0,
             end_time=1441,
             power=2.5,
-            days_effective=[True, True, True, True, True, True, True],
+            days_effective=ALL_DAYS,
         ),
     ]
 
@@ -75,7 +77,7 @@ def test_all_days_of_week_covered():
             start_time=0,
             end_time=15,
             power=2.5,
-            days_effective=[False, True, True, True, True, True, True],
+            days_effective=(False, True, True, True, True, True, True),
         ),
     ]
 
@@ -92,19 +94,19 @@ def test_multiple_periods_on_a_day():
             start_time=0,
             end_time=1439,
             power=2.5,
-            days_effective=[False, True, True, True, True, True, True],
+            days_effective=(False, True, True, True, True, True, True),
         ),
         PeakSettingPeriod(
             start_time=0,
             end_time=600,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
         PeakSettingPeriod(
             start_time=600,
             end_time=1439,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
     ]
 
@@ -115,19 +117,19 @@ def test_multiple_periods_on_a_day():
             start_time=0,
             end_time=1439,
             power=2.5,
-            days_effective=[False, True, True, True, True, True, True],
+            days_effective=(False, True, True, True, True, True, True),
         ),
         PeakSettingPeriod(
             start_time=0,
             end_time=600,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
         PeakSettingPeriod(
             start_time=601,
             end_time=1439,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
     ]
 
@@ -138,19 +140,19 @@ def test_multiple_periods_on_a_day():
             start_time=0,
             end_time=1439,
             power=2.5,
-            days_effective=[False, True, True, True, True, True, True],
+            days_effective=(False, True, True, True, True, True, True),
         ),
         PeakSettingPeriod(
             start_time=0,
             end_time=600,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
         PeakSettingPeriod(
             start_time=602,
             end_time=1439,
             power=2.5,
-            days_effective=[True, False, False, False, False, False, False],
+            days_effective=(True, False, False, False, False, False, False),
         ),
     ]
 
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -6,94 +6,56 @@ import huawei_solar.register_names as rn
 from huawei_solar.exceptions import TimeOfUsePeriodsException
 from huawei_solar.registers import REGISTERS, HUAWEI_LUNA2000_TimeOfUsePeriod, LG_RESU_TimeOfUsePeriod
 
+ALL_DAYS = (True,) * 7
+
 huawei_ppr = REGISTERS[rn.STORAGE_HUAWEI_LUNA2000_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS]
 lg_ppr = REGISTERS[rn.STORAGE_LG_RESU_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS]
 
 
-def test__validate__tou_periods__HUAWEI_LUNA2000__too_long_span__start_time():
-    tou = HUAWEI_LUNA2000_TimeOfUsePeriod(
-        start_time=60 * 24 + 1,
-        end_time=15,
-        charge_flag=0,
-        days_effective=[True, True, True, True, True, True, True],
-    )
-    with pytest.raises(
-        expected_exception=TimeOfUsePeriodsException,
-        match=r"TOU period is invalid \(Spans over more than one day\)",
-    ):
-        huawei_ppr._validate([tou])
-
-
-def test__validate__tou_periods__HUAWEI_LUNA2000__too_long_span__end_time():
-    tou = HUAWEI_LUNA2000_TimeOfUsePeriod(
-        start_time=15,
-        end_time=60 * 24 + 1,
-        charge_flag=0,
-        days_effective=[True, True, True, True, True, True, True],
-    )
-    with pytest.raises(
-        expected_exception=TimeOfUsePeriodsException,
-        match=r"TOU period is invalid \(Spans over more than one day\)",
-    ):
-        huawei_ppr._validate([tou])
-
-
-def test__validate__tou_periods__HUAWEI_LUNA2000__negative__start_time():
-    tou = HUAWEI_LUNA2000_TimeOfUsePeriod(
-        start_time=-10,
-        end_time=15,
+def _luna_period(start_time: int, end_time: int, days_effective=ALL_DAYS) -> HUAWEI_LUNA2000_TimeOfUsePeriod:
+    return HUAWEI_LUNA2000_TimeOfUsePeriod(
+        start_time=start_time,
+        end_time=end_time,
         charge_flag=0,
-        days_effective=[True, True, True, True, True, True, True],
+        days_effective=days_effective,
     )
-    with pytest.raises(
-        expected_exception=TimeOfUsePeriodsException,
-        match=r"TOU period is invalid \(Below zero\)",
-    ):
-        huawei_ppr._validate([tou])
 
 
-def test__validate__tou_periods__HUAWEI_LUNA2000__negative__end_time():
-    tou = HUAWEI_LUNA2000_TimeOfUsePeriod(
-        start_time=15,
-        end_time=-2,
-        charge_flag=0,
-        days_effective=[True, True, True, True, True, True, True],
-    )
-    with pytest.raises(
-        expected_exception=TimeOfUsePeriodsException,
-        match=r"TOU period is invalid \(Below zero\)",
-    ):
-        huawei_ppr._validate([tou])
-
-
-def test__validate__tou_periods__HUAWEI_LUNA2000__start_time_bigger_than_end_time():
-    tou = HUAWEI_LUNA2000_TimeOfUsePeriod(
-        start_time=15,
-        end_time=2,
-        charge_flag=0,
-        days_effective=[True, True, True, True, True, True, True],
-    )
-    with pytest.raises(
-        expected_exception=TimeOfUsePeriodsException,
-        match=r"TOU period is invalid \(start-time is greater than end-time\)",
-    ):
+@pytest.mark.parametrize(
+    ("start_time", "end_time", "message"),
+    [
+        pytest.param(
+            60 * 24 + 1,
+            15,
+            r"TOU period is invalid \(Spans over more than one day\)",
+            id="too_long_span__start_time",
+        ),
+        pytest.param(
+            15,
+            60 * 24 + 1,
+            r"TOU period is invalid \(Spans over more than one day\)",
+            id="too_long_span__end_time",
+        ),
+        pytest.param(-10, 15, r"TOU period is invalid \(Below zero\)", id="negative__start_time"),
+        pytest.param(15, -2, r"TOU period is invalid \(Below zero\)", id="negative__end_time"),
+        pytest.param(
+            15,
+            2,
+            r"TOU period is invalid \(start-time is greater than end-time\)",
+            id="start_time_bigger_than_end_time",
+        ),
+    ],
+)
+def test__validate__tou_periods__HUAWEI_LUNA2000__invalid_period(start_time: int, end_time: int, message: str):
+    tou = _luna_period(start_time, end_time)
+    with pytest.raises(expected_exception=TimeOfUsePeriodsException, match=message):
         huawei_ppr._validate([tou])
 
 
 def test__validate__tou_periods__HUAWEI_LUNA2000__overlapping__1():
     tou = [
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=120,
-            end_time=160,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=100,
-            end_time=150,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
+        _luna_period(120, 160),
+        _luna_period(100, 150),
     ]
     with pytest.raises(
         expected_exception=TimeOfUsePeriodsException,
@@ -104,18 +66,8 @@ def test__validate__tou_periods__HUAWEI_LUNA2000__overlapping__1():
 
 def test__validate__tou_periods__HUAWEI_LUNA2000__overlapping__2():
     tou = [
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=15,
-            end_time=120,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=100,
-            end_time=150,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
+        _luna_period(15, 120),
+        _luna_period(100, 150),
     ]
     with pytest.raises(
         expected_exception=TimeOfUsePeriodsException,
@@ -126,54 +78,24 @@ def test__validate__tou_periods__HUAWEI_LUNA2000__overlapping__2():
 
 def test__validate__tou_periods__HUAWEI_LUNA2000__OK():
     tou = [
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=15,
-            end_time=120,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=121,
-            end_time=150,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
+        _luna_period(15, 120),
+        _luna_period(121, 150),
     ]
     huawei_ppr._validate(tou)
 
 
 def test__validate__tou_periods__HUAWEI_LUNA2000__OK_2():
     tou = [
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=15,
-            end_time=120,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=0,
-            end_time=14,
-            charge_flag=0,
-            days_effective=[True, True, True, True, True, True, True],
-        ),
+        _luna_period(15, 120),
+        _luna_period(0, 14),
     ]
     huawei_ppr._validate(tou)
 
 
 def test__validate__tou_periods__HUAWEI_LUNA2000__OK__different_days():
     tou = [
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=0,
-            end_time=120,
-            charge_flag=0,
-            days_effective=[False, False, False, True, True, False, True],
-        ),
-        HUAWEI_LUNA2000_TimeOfUsePeriod(
-            start_time=0,
-            end_time=120,
-            charge_flag=0,
-            days_effective=[True, False, True, False, False, True, False],
-        ),
+        _luna_period(0, 120, (False, False, False, True, True, False, True)),
+        _luna_period(0, 120, (True, False, True, False, False, True, False)),
     ]
 
     huawei_ppr._validate(tou)
@@ -200,10 +122,7 @@ def test__validate__tou_periodsG__RESU___overlaping():
 
 
 def test__validate__tou_periods__unknown_type():
-    mock = MagicMock()
-    mock.start_time = 10
-    mock.end_time = 20
-    tou = [mock]
+    tou = [SimpleNamespace(start_time=10, end_time=20)]
     with pytest.raises(
         expected_exception=TimeOfUsePeriodsException,
         match="TOU period is of an unexpected type",
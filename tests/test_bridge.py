@@ -1,6 +1,11 @@
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 import huawei_solar.register_names as rn
+from huawei_solar.bridge import _plan_batches
+
+from .conftest import MOCK_REGISTERS
 
 
 @pytest.mark.asyncio
@@ -25,3 +30,33 @@ async def test_get_multiple(huawei_bridge):
     assert result[rn.LINE_VOLTAGE_B_C].unit == "V"
     assert result[rn.LINE_VOLTAGE_C_A].value == 0
     assert result[rn.LINE_VOLTAGE_C_A].unit == "V"
+
+
+def test_plan_batches():
+    batches = _plan_batches((rn.PHASE_A_VOLTAGE, rn.MODEL_NAME, rn.INPUT_POWER, rn.SERIAL_NUMBER, rn.STATE_1))
+
+    assert batches == (
+        (rn.MODEL_NAME, rn.SERIAL_NUMBER),
+        (rn.STATE_1,),
+        (rn.INPUT_POWER, rn.PHASE_A_VOLTAGE),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("dst", "time_zone", "expected_offset"),
+    [
+        pytest.param(0, 60, timedelta(hours=1), id="dst_off"),
+        pytest.param(1, 60, timedelta(hours=2), id="dst_on"),
+        pytest.param(0, 0x7FFF, timedelta(0), id="time_zone_invalid"),
+    ],
+)
+async def test_timestamp_is_shifted_to_utc(monkeypatch, huawei_bridge, dst, time_zone, expected_offset):
+    monkeypatch.setitem(MOCK_REGISTERS, (42900, 1), [dst])
+    monkeypatch.setitem(MOCK_REGISTERS, (43006, 1), [time_zone])
+
+    await huawei_bridge._update_time_zone()
+    result = await huawei_bridge.batch_update([rn.SYSTEM_TIME])
+
+    expected = datetime.fromtimestamp(1642975595) - expected_offset
+    assert result[rn.SYSTEM_TIME].value == expected.astimezone(tz=UTC)
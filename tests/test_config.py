@@ -1,51 +1,61 @@
 """check if the register config is correct"""
 
 import logging
+from collections.abc import Iterable
 
-from huawei_solar.registers import REGISTERS, TargetDevice
+import pytest
+
+from huawei_solar.registers import RegisterDefinition, TargetDevice, U16Register, U32Register, registers_for
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _check_register_order(device_registers: Iterable[tuple[str, RegisterDefinition]]):
+    prev_start = prev_end = None
+    for _, reg in device_registers:
+        if reg.register == prev_start:
+            # registers at the same address are different views on the same value,
+            # so check the next register against the end of the longest one
+            prev_end = max(prev_end, reg.register + reg.length)
+            continue
+
+        if prev_end is not None:
+            if prev_end > reg.register:
+                raise ValueError(
+                    f"Requested registers must be in monotonically increasing order, "
+                    f"but {prev_start} ends at {prev_end} > {reg.register}!",
+                )
+            if prev_end < reg.register:
+                _LOGGER.info("There is a gap between %s and %s!", prev_start, reg.register)
+
+        prev_start, prev_end = reg.register, reg.register + reg.length
+
+
 def test_register_config():
     """Parse all REGISTERS and check for correct order and potential overlaps"""
-    registers = [r for r in REGISTERS.values() if TargetDevice.SUN2000 in r.target_device]
-    registers.sort(key=lambda x: x.register)
-
-    for idx in range(1, len(registers)):
-        if registers[idx].register in [32066, 32072, 40000, 47028, 47255]:
-            # skip these registers, as they have multiple entries
-            continue
-        if registers[idx - 1].register + registers[idx - 1].length > registers[idx].register:
-            raise ValueError(
-                f"Requested registers must be in monotonically increasing order, "
-                f"but {registers[idx-1].register} + {registers[idx-1].length} > {registers[idx].register}!",
-            )
-        if registers[idx - 1].register + registers[idx - 1].length < registers[idx].register:
-            _LOGGER.info(
-                "There is a gap between %s and %s!",
-                {registers[idx - 1].register},
-                {registers[idx].register},
-            )
+    _check_register_order(registers_for(TargetDevice.SUN2000))
 
 
 def test_register_config_emma():
     """Parse all REGISTERS and check for correct order and potential overlaps"""
-    registers = [r for r in REGISTERS.values() if TargetDevice.EMMA in r.target_device]
-    registers.sort(key=lambda x: x.register)
-
-    for idx in range(1, len(registers)):
-        if registers[idx].register in []:
-            # skip these registers, as they have multiple entries
-            continue
-        if registers[idx - 1].register + registers[idx - 1].length > registers[idx].register:
-            raise ValueError(
-                f"Requested registers must be in monotonically increasing order, "
-                f"but {registers[idx-1].register} + {registers[idx-1].length} > {registers[idx].register}!",
-            )
-        if registers[idx - 1].register + registers[idx - 1].length < registers[idx].register:
-            _LOGGER.info(
-                "There is a gap between %s and %s!",
-                {registers[idx - 1].register},
-                {registers[idx].register},
-            )
+    _check_register_order(registers_for(TargetDevice.EMMA))
+
+
+def test_register_order_check_detects_overlap():
+    """Check that overlapping registers are detected, while aliases are allowed"""
+    _check_register_order(
+        (
+            ("a", U32Register(None, 1, 100)),
+            ("a_alias", U16Register(None, 1, 100)),
+            ("b", U16Register(None, 1, 102)),
+        ),
+    )
+
+    with pytest.raises(ValueError, match="monotonically increasing order"):
+        _check_register_order(
+            (
+                ("a", U32Register(None, 1, 100)),
+                ("a_alias", U16Register(None, 1, 100)),
+                ("b", U16Register(None, 1, 101)),
+            ),
+        )
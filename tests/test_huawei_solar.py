@@ -1,59 +1,122 @@
-from unittest.mock import patch
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
 
 import pytest
 from pymodbus.register_read_message import ReadHoldingRegistersResponse
 
 import huawei_solar.register_names as rn
 import huawei_solar.register_values as rv
+from huawei_solar import huawei_solar as huawei_solar_module
 from huawei_solar.exceptions import DecodeError
+from huawei_solar.huawei_solar import _plan_read
 from huawei_solar.register_values import GridCode
-
-
-@pytest.mark.asyncio
-async def test_get_model_name(huawei_solar):
-    result = await huawei_solar.get(rn.MODEL_NAME)
-    assert result.value == "SUN2000-3KTL-L1"
-    assert result.unit is None
+from huawei_solar.registers import U16Register, U32Register
+
+# responses are only read by the client, so they can be built once and shared between tests
+INVALID_MODEL_NAME_RESPONSE = ReadHoldingRegistersResponse(
+    # invalid utf-8 sequence from here:
+    # https://stackoverflow.com/questions/1301402/example-invalid-utf8-string
+    [21333, 20018, 12336, 12333, 13131, 21580, 11596, 12544, 0, 0, 0, 0, 0, 226, 10370],
+)
+NEGATIVE_ENERGY_RESPONSE = ReadHoldingRegistersResponse([65535, 65036])  # -500
+STATE_1_EXTRA_BITS_RESPONSE = ReadHoldingRegistersResponse([0b0111_1100_0000_0000])
+STATE_2_EXTRA_BITS_RESPONSE = ReadHoldingRegistersResponse([0b0111_1111_1111_1000])
+STATE_3_EXTRA_BITS_RESPONSE = ReadHoldingRegistersResponse([0b0111_1111_1111_1111, 0b0111_1111_1111_1111])
+NO_BITS_SET_RESPONSE = ReadHoldingRegistersResponse([0])
+ALL_BITS_SET_RESPONSE = ReadHoldingRegistersResponse([0b1111_1111_1111_1111])
+ALARM_3_ALMOST_ALL_RESPONSE = ReadHoldingRegistersResponse([0b0111_1111_1111_1111])
+ALARM_3_3RD_OCTET_RESPONSE = ReadHoldingRegistersResponse([0b0000_1110_0000_0000])
+INVALID_DEVICE_STATUS_RESPONSE = ReadHoldingRegistersResponse([0b0000_0010_1111_1111])
+
+
+@contextmanager
+def stub_read(huawei_solar, response: ReadHoldingRegistersResponse) -> Iterator[None]:
+    """Make every register read return the given response, without going through a mock object."""
+
+    async def _read_registers(*_args, **_kwargs):
+        return response
+
+    huawei_solar._read_registers = _read_registers
+    try:
+        yield
+    finally:
+        del huawei_solar._read_registers
+
+
+ALARM_CODES_3 = list(rv.ALARM_CODES_3.values())
+
+SIMPLE_REGISTER_CASES = [
+    pytest.param(rn.MODEL_NAME, "SUN2000-3KTL-L1", None, id="model_name"),
+    pytest.param(rn.SERIAL_NUMBER, "HV3021621085", None, id="serial_number"),
+    pytest.param("model_id", 348, None, id="model_id"),
+    pytest.param("nb_pv_strings", 2, None, id="nb_pv_strings"),
+    pytest.param("nb_mpp_tracks", 2, None, id="nb_mpp_tracks"),
+    pytest.param("rated_power", 3000, "W", id="rated_power"),
+    pytest.param("P_max", 3300, "W", id="p_max"),
+    pytest.param("S_max", 3300, "VA", id="s_max"),
+    pytest.param("Q_max_out", 1980, "var", id="q_max_out"),
+    pytest.param("Q_max_in", -1980, "var", id="q_max_in"),
+    pytest.param(rn.STATE_1, ["Standby"], None, id="state_1"),
+    pytest.param(rn.STATE_2, ["Locked", "PV disconnected", "No DSP data collection"], None, id="state_2"),
+    pytest.param(rn.STATE_3, ["On-grid", "Off-grid switch disabled"], None, id="state_3"),
+    pytest.param(rn.ALARM_1, [rv.ALARM_CODES_1[1], rv.ALARM_CODES_1[256]], None, id="alarm_1_some"),
+    pytest.param(rn.ALARM_2, [rv.ALARM_CODES_2[2], rv.ALARM_CODES_2[512]], None, id="alarm_2_some"),
+    pytest.param(rn.ALARM_3, ALARM_CODES_3[0:2] + ALARM_CODES_3[3:5], None, id="alarm_3_some"),
+    pytest.param("pv_01_voltage", 0, "V", id="pv_01_voltage"),
+    pytest.param("pv_01_current", 0, "A", id="pv_01_current"),
+    pytest.param("pv_02_voltage", 0, "V", id="pv_02_voltage"),
+    pytest.param("pv_02_current", 0, "A", id="pv_02_current"),
+    pytest.param("pv_03_voltage", 0, "V", id="pv_03_voltage"),
+    pytest.param("pv_03_current", 0, "A", id="pv_03_current"),
+    pytest.param("pv_04_voltage", 0, "V", id="pv_04_voltage"),
+    pytest.param("pv_04_current", 0, "A", id="pv_04_current"),
+    pytest.param(rn.PV_01_VOLTAGE, 0.0, "V", id="rn_pv_01_voltage"),
+    pytest.param(rn.INPUT_POWER, 0, "W", id="input_power"),
+    pytest.param(rn.GRID_VOLTAGE, 0.0, "V", id="grid_voltage"),
+    pytest.param(rn.LINE_VOLTAGE_A_B, 0, "V", id="line_voltage_a_b"),
+    pytest.param(rn.LINE_VOLTAGE_B_C, 0, "V", id="line_voltage_b_c"),
+    pytest.param(rn.LINE_VOLTAGE_C_A, 0, "V", id="line_voltage_c_a"),
+    pytest.param(rn.PHASE_A_VOLTAGE, 0, "V", id="line_phase_a_voltage"),
+    pytest.param(rn.PHASE_B_VOLTAGE, 0, "V", id="line_phase_b_voltage"),
+    pytest.param(rn.PHASE_C_VOLTAGE, 0, "V", id="line_phase_c_voltage"),
+    pytest.param("grid_current", 0, "A", id="grid_current"),
+    pytest.param("phase_A_current", 0, "A", id="phase_a_current"),
+    pytest.param("phase_B_current", 0, "A", id="phase_b_current"),
+    pytest.param("phase_C_current", 0, "A", id="phase_c_current"),
+    pytest.param("day_active_power_peak", 225, "W", id="day_active_power_peak"),
+    pytest.param("active_power", 0, "W", id="active_power"),
+    pytest.param("reactive_power", 0, "var", id="reactive_power"),
+    pytest.param("power_factor", 0.0, None, id="power_factor"),
+    pytest.param("grid_frequency", 0.0, "Hz", id="grid_frequency"),
+    pytest.param("efficiency", 0.0, "%", id="efficiency"),
+    pytest.param("internal_temperature", 0.0, "°C", id="internal_temperature"),
+    pytest.param(rn.INSULATION_RESISTANCE, 3.0, "MOhm", id="insulation_resistance"),
+    pytest.param(rn.DEVICE_STATUS, "Standby: no irradiation", None, id="device_status"),
+    pytest.param(rn.FAULT_CODE, 0, None, id="fault_code"),
+    pytest.param(rn.ACCUMULATED_YIELD_ENERGY, 207.34, "kWh", id="accumulated_yield_energy"),
+    pytest.param(rn.DAILY_YIELD_ENERGY, 0.65, "kWh", id="daily_yield_energy"),
+    pytest.param(rn.NB_OPTIMIZERS, 10, None, id="nb_optimizers"),
+    pytest.param(rn.NB_ONLINE_OPTIMIZERS, 0, None, id="nb_online_optimizers"),
+    pytest.param(rn.TIME_ZONE, 60, "min", id="time_zone"),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("register_name", "expected_value", "expected_unit"), SIMPLE_REGISTER_CASES)
+async def test_get_simple_register(huawei_solar, register_name, expected_value, expected_unit):
+    result = await huawei_solar.get(register_name)
+    assert result.value == expected_value
+    assert result.unit == expected_unit
 
 
 @pytest.mark.asyncio
 async def test_get_invalid_model_name(huawei_solar):
     with (
-        patch.object(
-            huawei_solar,
-            "_read_registers",
-            return_value=ReadHoldingRegistersResponse(
-                [
-                    21333,
-                    20018,
-                    12336,
-                    12333,
-                    13131,
-                    21580,
-                    11596,
-                    12544,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    226,
-                    10370,
-                ],
-            ),
-        ),
+        stub_read(huawei_solar, INVALID_MODEL_NAME_RESPONSE),
         pytest.raises(DecodeError),
     ):
         await huawei_solar.get("model_name")
-        # invalid utf-8 sequence from here:
-        # https://stackoverflow.com/questions/1301402/example-invalid-utf8-string
-
-
-@pytest.mark.asyncio
-async def test_get_serial_number(huawei_solar):
-    result = await huawei_solar.get(rn.SERIAL_NUMBER)
-    assert result.value == "HV3021621085"
-    assert result.unit is None
 
 
 @pytest.mark.asyncio
@@ -67,457 +130,64 @@ async def test_get_multiple(huawei_solar):
 
 
 @pytest.mark.asyncio
-async def test_get_model_id(huawei_solar):
-    result = await huawei_solar.get("model_id")
-    assert result.value == 348
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_nb_pv_strings(huawei_solar):
-    result = await huawei_solar.get("nb_pv_strings")
-    assert result.value == 2
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_nb_mpp_tracks(huawei_solar):
-    result = await huawei_solar.get("nb_mpp_tracks")
-    assert result.value == 2
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_rated_power(huawei_solar):
-    result = await huawei_solar.get("rated_power")
-    assert result.value == 3000
-    assert result.unit == "W"
-
-
-@pytest.mark.asyncio
-async def test_get_p_max(huawei_solar):
-    result = await huawei_solar.get("P_max")
-    assert result.value == 3300
-    assert result.unit == "W"
-
-
-@pytest.mark.asyncio
-async def test_get_s_max(huawei_solar):
-    result = await huawei_solar.get("S_max")
-    assert result.value == 3300
-    assert result.unit == "VA"
-
-
-@pytest.mark.asyncio
-async def test_get_q_max_out(huawei_solar):
-    result = await huawei_solar.get("Q_max_out")
-    assert result.value == 1980
-    assert result.unit == "var"
-
-
-@pytest.mark.asyncio
-async def test_get_q_max_in(huawei_solar):
-    result = await huawei_solar.get("Q_max_in")
-    assert result.value == -1980
-    assert result.unit == "var"
-
-
-@pytest.mark.asyncio
-async def test_get_state_1(huawei_solar):
-    result = await huawei_solar.get(rn.STATE_1)
-    assert result.value == ["Standby"]
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_state_1_extra_bits_set(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b0111_1100_0000_0000]),
-    ):
-        result = await huawei_solar.get(rn.STATE_1)
-        assert result.value == []
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_state_2(huawei_solar):
-    result = await huawei_solar.get(rn.STATE_2)
-    assert result.value == ["Locked", "PV disconnected", "No DSP data collection"]
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_state_2_extra_bits_set(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b0111_1111_1111_1000]),
-    ):
-        result = await huawei_solar.get(rn.STATE_2)
-
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_state_3(huawei_solar):
-    result = await huawei_solar.get(rn.STATE_3)
-    assert result.value == ["On-grid", "Off-grid switch disabled"]
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_state_3_extra_bits_set(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse(
-            [0b0111_1111_1111_1111, 0b0111_1111_1111_1111],
-        ),
-    ):
-        result = await huawei_solar.get(rn.STATE_3)
-        assert result.value, ["Off-grid", "Off-grid switch enabled"]
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_1_some(huawei_solar):
-    result = await huawei_solar.get(rn.ALARM_1)
-    expected_result = [
-        rv.ALARM_CODES_1[1],
-        rv.ALARM_CODES_1[256],
-    ]
-    assert result.value == expected_result
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_1_none(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_1)
-        assert result.value == []
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_1_all(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b1111_1111_1111_1111]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_1)
-        expected_result = list(rv.ALARM_CODES_1.values())
-        assert result.value == expected_result
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_2_some(huawei_solar):
-    result = await huawei_solar.get(rn.ALARM_2)
-    expected_result = [
-        rv.ALARM_CODES_2[2],
-        rv.ALARM_CODES_2[512],
-    ]
-    assert result.value == expected_result
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_2_none(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_2)
-        expected_result = []
-        assert result.value == expected_result
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_2_all(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b1111_1111_1111_1111]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_2)
-        expected_result = list(rv.ALARM_CODES_2.values())
-        assert result.value == expected_result
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_3_some(huawei_solar):
-    result = await huawei_solar.get(rn.ALARM_3)
-    expected_result = list(rv.ALARM_CODES_3.values())[0:2] + list(rv.ALARM_CODES_3.values())[3:5]
-    assert result.value == expected_result
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_3_almost_all(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b0111_1111_1111_1111]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_3)
-        expected_result = list(rv.ALARM_CODES_3.values())[:-1]
-        assert result.value == expected_result
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_alarm_3_3rd_octet_bits_set(huawei_solar):
-    with patch.object(
-        huawei_solar,
-        "_read_registers",
-        return_value=ReadHoldingRegistersResponse([0b0000_1110_0000_0000]),
-    ):
-        result = await huawei_solar.get(rn.ALARM_3)
-        expected_result = list(rv.ALARM_CODES_3.values())[9:12]
-        assert result.value == expected_result
-        assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_pv_01_voltage(huawei_solar):
-    result = await huawei_solar.get("pv_01_voltage")
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_01_current(huawei_solar):
-    result = await huawei_solar.get("pv_01_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_02_voltage(huawei_solar):
-    result = await huawei_solar.get("pv_02_voltage")
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_02_current(huawei_solar):
-    result = await huawei_solar.get("pv_02_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_03_voltage(huawei_solar):
-    result = await huawei_solar.get("pv_03_voltage")
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_03_current(huawei_solar):
-    result = await huawei_solar.get("pv_03_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_04_voltage(huawei_solar):
-    result = await huawei_solar.get("pv_04_voltage")
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_pv_04_current(huawei_solar):
-    result = await huawei_solar.get("pv_04_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_(huawei_solar):
-    result = await huawei_solar.get(rn.PV_01_VOLTAGE)
-    assert result.value == 0.0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_input_power(huawei_solar):
-    result = await huawei_solar.get(rn.INPUT_POWER)
-    assert result.value == 0
-    assert result.unit == "W"
-
-
-@pytest.mark.asyncio
-async def test_get_grid_voltage(huawei_solar):
-    result = await huawei_solar.get(rn.GRID_VOLTAGE)
-    assert result.value == 0.0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_voltage_a_b(huawei_solar):
-    result = await huawei_solar.get(rn.LINE_VOLTAGE_A_B)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_voltage_b_c(huawei_solar):
-    result = await huawei_solar.get(rn.LINE_VOLTAGE_B_C)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_voltage_c_a(huawei_solar):
-    result = await huawei_solar.get(rn.LINE_VOLTAGE_C_A)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_phase_a_voltage(huawei_solar):
-    result = await huawei_solar.get(rn.PHASE_A_VOLTAGE)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_phase_b_voltage(huawei_solar):
-    result = await huawei_solar.get(rn.PHASE_B_VOLTAGE)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_line_phase_c_voltage(huawei_solar):
-    result = await huawei_solar.get(rn.PHASE_C_VOLTAGE)
-    assert result.value == 0
-    assert result.unit == "V"
-
-
-@pytest.mark.asyncio
-async def test_get_grid_current(huawei_solar):
-    result = await huawei_solar.get("grid_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_phase_a_current(huawei_solar):
-    result = await huawei_solar.get("phase_A_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_phase_b_current(huawei_solar):
-    result = await huawei_solar.get("phase_B_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_phase_c_current(huawei_solar):
-    result = await huawei_solar.get("phase_C_current")
-    assert result.value == 0
-    assert result.unit == "A"
-
-
-@pytest.mark.asyncio
-async def test_get_day_active_power_peak(huawei_solar):
-    result = await huawei_solar.get("day_active_power_peak")
-    assert result.value == 225
-    assert result.unit == "W"
-
-
-@pytest.mark.asyncio
-async def test_get_active_power(huawei_solar):
-    result = await huawei_solar.get("active_power")
-    assert result.value == 0
-    assert result.unit == "W"
-
-
-@pytest.mark.asyncio
-async def test_get_reactive_power(huawei_solar):
-    result = await huawei_solar.get("reactive_power")
-    assert result.value == 0
-    assert result.unit == "var"
-
-
-@pytest.mark.asyncio
-async def test_get_power_factor(huawei_solar):
-    result = await huawei_solar.get("power_factor")
-    assert result.value == 0.0
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_grid_frequency(huawei_solar):
-    result = await huawei_solar.get("grid_frequency")
-    assert result.value == 0.0
-    assert result.unit == "Hz"
-
-
-@pytest.mark.asyncio
-async def test_get_efficiency(huawei_solar):
-    result = await huawei_solar.get("efficiency")
-    assert result.value == 0.0
-    assert result.unit == "%"
-
-
-@pytest.mark.asyncio
-async def test_get_internal_temperature(huawei_solar):
-    result = await huawei_solar.get("internal_temperature")
-    assert result.value == 0.0
-    assert result.unit == "°C"
-
-
-@pytest.mark.asyncio
-async def test_get_insulation_resistance(huawei_solar):
-    result = await huawei_solar.get(rn.INSULATION_RESISTANCE)
-    assert result.value == 3.0
-    assert result.unit == "MOhm"
+async def test_get_negative_grid_exported_energy(huawei_solar):
+    with stub_read(huawei_solar, NEGATIVE_ENERGY_RESPONSE):
+        result = await huawei_solar.get(rn.GRID_EXPORTED_ENERGY)
+    assert result.value == 5.0
+    assert result.unit == "kWh"
 
 
-@pytest.mark.asyncio
-async def test_get_device_status(huawei_solar):
-    result = await huawei_solar.get(rn.DEVICE_STATUS)
-    assert result.value == "Standby: no irradiation"
+BIT_PATTERN_CASES = [
+    pytest.param(rn.STATE_1, STATE_1_EXTRA_BITS_RESPONSE, [], id="state_1_extra_bits_set"),
+    pytest.param(
+        rn.STATE_2,
+        STATE_2_EXTRA_BITS_RESPONSE,
+        ["Locked", "PV disconnected", "No DSP data collection"],
+        id="state_2_extra_bits_set",
+    ),
+    pytest.param(
+        rn.STATE_3,
+        STATE_3_EXTRA_BITS_RESPONSE,
+        ["Off-grid", "Off-grid switch enabled"],
+        id="state_3_extra_bits_set",
+    ),
+    pytest.param(rn.ALARM_1, NO_BITS_SET_RESPONSE, [], id="alarm_1_none"),
+    pytest.param(rn.ALARM_1, ALL_BITS_SET_RESPONSE, list(rv.ALARM_CODES_1.values()), id="alarm_1_all"),
+    pytest.param(rn.ALARM_2, NO_BITS_SET_RESPONSE, [], id="alarm_2_none"),
+    pytest.param(rn.ALARM_2, ALL_BITS_SET_RESPONSE, list(rv.ALARM_CODES_2.values()), id="alarm_2_all"),
+    pytest.param(
+        rn.ALARM_3,
+        ALARM_3_ALMOST_ALL_RESPONSE,
+        ALARM_CODES_3[:-1],
+        id="alarm_3_almost_all",
+    ),
+    pytest.param(
+        rn.ALARM_3,
+        ALARM_3_3RD_OCTET_RESPONSE,
+        ALARM_CODES_3[9:12],
+        id="alarm_3_3rd_octet_bits_set",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("register_name", "response", "expected_value"), BIT_PATTERN_CASES)
+async def test_get_bit_pattern(huawei_solar, register_name, response, expected_value):
+    with stub_read(huawei_solar, response):
+        result = await huawei_solar.get(register_name)
+    assert result.value == expected_value
     assert result.unit is None
 
 
 @pytest.mark.asyncio
 async def test_get_device_status_invalid(huawei_solar):
     with (
-        patch.object(
-            huawei_solar,
-            "_read_registers",
-            return_value=ReadHoldingRegistersResponse([0b0000_0010_1111_1111]),
-        ),
+        stub_read(huawei_solar, INVALID_DEVICE_STATUS_RESPONSE),
         pytest.raises(DecodeError),
     ):
         await huawei_solar.get(rn.DEVICE_STATUS)
 
 
-@pytest.mark.asyncio
-async def test_get_fault_code(huawei_solar):
-    result = await huawei_solar.get(rn.FAULT_CODE)
-    assert result.value == 0
-    assert result.unit is None
-
-
 # @pytest.mark.asyncio()
 # async def test_get_startup_time(huawei_solar):
 #     result = await huawei_solar.get(rn.STARTUP_TIME)
@@ -533,34 +203,6 @@ async def test_get_fault_code(huawei_solar):
 #     assert result.unit is None
 
 
-@pytest.mark.asyncio
-async def test_get_accumulated_yield_energy(huawei_solar):
-    result = await huawei_solar.get(rn.ACCUMULATED_YIELD_ENERGY)
-    assert result.value == 207.34
-    assert result.unit == "kWh"
-
-
-@pytest.mark.asyncio
-async def test_get_daily_yield_energy(huawei_solar):
-    result = await huawei_solar.get(rn.DAILY_YIELD_ENERGY)
-    assert result.value == 0.65
-    assert result.unit == "kWh"
-
-
-@pytest.mark.asyncio
-async def test_get_nb_optimizers(huawei_solar):
-    result = await huawei_solar.get(rn.NB_OPTIMIZERS)
-    assert result.value == 10
-    assert result.unit is None
-
-
-@pytest.mark.asyncio
-async def test_get_nb_online_optimizers(huawei_solar):
-    result = await huawei_solar.get(rn.NB_ONLINE_OPTIMIZERS)
-    assert result.value == 0
-    assert result.unit is None
-
-
 # @pytest.mark.asyncio()
 # async def test_get_system_time(huawei_solar):
 #     result = await huawei_solar.get(rn.SYSTEM_TIME)
@@ -569,6 +211,14 @@ async def test_get_nb_online_optimizers(huawei_solar):
 #     assert result.unit is None
 
 
+@pytest.mark.asyncio
+async def test_get_system_time_and_raw_system_time(huawei_solar):
+    system_time, system_time_raw = await huawei_solar.get_multiple([rn.SYSTEM_TIME, rn.SYSTEM_TIME_RAW])
+    assert system_time_raw.value == 1642975595
+    assert system_time_raw.unit == "seconds"
+    assert system_time.value == datetime.fromtimestamp(1642975595)
+
+
 @pytest.mark.asyncio
 async def test_get_grid_code(huawei_solar):
     result = await huawei_solar.get(rn.GRID_CODE)
@@ -578,7 +228,42 @@ async def test_get_grid_code(huawei_solar):
 
 
 @pytest.mark.asyncio
-async def test_get_time_zone(huawei_solar):
-    result = await huawei_solar.get(rn.TIME_ZONE)
-    assert result.value == 60
-    assert result.unit == "min"
+async def test_get_multiple_reuses_read_plan(huawei_solar):
+    _plan_read.cache_clear()
+    await huawei_solar.get_multiple([rn.SYSTEM_TIME, rn.SYSTEM_TIME_RAW])
+    result = await huawei_solar.get_multiple([rn.SYSTEM_TIME, rn.SYSTEM_TIME_RAW])
+
+    assert _plan_read.cache_info().hits == 1
+    assert result[1].value == 1642975595
+
+
+@pytest.mark.asyncio
+async def test_get_multiple_invalid_names_are_not_cached(huawei_solar):
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Did not recognize register names"):
+            await huawei_solar.get_multiple(["does_not_exist"])
+
+
+def test_plan_read_rejects_overlap_with_longest_alias(monkeypatch):
+    monkeypatch.setattr(
+        huawei_solar_module,
+        "REGISTERS",
+        {
+            "long": U32Register(None, 1, 100),
+            "short_alias": U16Register(None, 1, 100),
+            "overlapping": U16Register(None, 1, 101),
+        },
+    )
+    try:
+        with pytest.raises(ValueError, match="monotonically increasing order"):
+            _plan_read(("long", "short_alias", "overlapping"))
+
+        assert _plan_read(("long", "short_alias")).length == 2
+    finally:
+        # the plan of the patched registers must not leak into other tests
+        _plan_read.cache_clear()
+
+
+def test_plan_read_rejects_large_gap():
+    with pytest.raises(ValueError, match="Gap between requested registers is too large"):
+        _plan_read((rn.MODEL_NAME, rn.INPUT_POWER))
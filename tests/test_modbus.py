@@ -0,0 +1,57 @@
+import socket
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from huawei_solar.modbus import (
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+    AsyncHuaweiSolarModbusTcpClient,
+    ModbusConnectionMixin,
+)
+
+
+def _tcp_client(monkeypatch):
+    # the base implementation needs a connected protocol, only check that it is still called
+    base_connection_made = MagicMock()
+    monkeypatch.setattr(ModbusConnectionMixin, "connection_made", base_connection_made)
+    return AsyncHuaweiSolarModbusTcpClient("192.0.2.1", 502, timeout=5), base_connection_made
+
+
+def _transport(sock):
+    transport = MagicMock()
+    transport.get_extra_info.return_value = sock
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_connection_made_enables_keepalive(monkeypatch):
+    client, base_connection_made = _tcp_client(monkeypatch)
+    sock = MagicMock()
+    transport = _transport(sock)
+
+    client.connection_made(transport)
+
+    transport.get_extra_info.assert_called_once_with("socket")
+    expected_calls = [call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for option, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+    ):
+        # the TCP keep-alive tuning options are not available on every platform
+        if hasattr(socket, option):
+            expected_calls.append(call(socket.IPPROTO_TCP, getattr(socket, option), value))
+    assert sock.setsockopt.call_args_list == expected_calls
+    base_connection_made.assert_called_once_with(transport)
+
+
+@pytest.mark.asyncio
+async def test_connection_made_without_socket(monkeypatch):
+    client, base_connection_made = _tcp_client(monkeypatch)
+    transport = _transport(None)
+
+    client.connection_made(transport)
+
+    base_connection_made.assert_called_once_with(transport)
@@ -1,8 +1,22 @@
+import pytest
 from pymodbus.constants import Endian
 from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
 
 import huawei_solar.register_names as rn
-from huawei_solar.registers import REGISTERS, PeakSettingPeriod
+import huawei_solar.register_values as rv
+from huawei_solar.exceptions import DecodeError
+from huawei_solar.registers import (
+    REGISTERS,
+    ChargeDischargePeriod,
+    ChargeFlag,
+    HUAWEI_LUNA2000_TimeOfUsePeriod,
+    LG_RESU_TimeOfUsePeriod,
+    PeakSettingPeriod,
+    TargetDevice,
+    bitfield_decoder,
+    flag_decoder,
+    registers_for,
+)
 
 
 def test_capacity_control_register():
@@ -38,3 +52,127 @@ def test_capacity_control_register():
     decoded_result = pspr.decode(decoder)
 
     assert decoded_result == value
+
+
+def test_registers_are_read_only():
+    with pytest.raises(TypeError):
+        REGISTERS[rn.MODEL_NAME] = REGISTERS[rn.SERIAL_NUMBER]  # type: ignore[index]
+
+
+def test_registers_have_no_instance_dict():
+    assert not any(hasattr(reg, "__dict__") for reg in REGISTERS.values())
+
+
+def test_registers_for():
+    emma_registers = registers_for(TargetDevice.EMMA)
+
+    assert {name for name, _ in emma_registers} == {
+        name for name, reg in REGISTERS.items() if TargetDevice.EMMA in reg.target_device
+    }
+    assert [reg.register for _, reg in emma_registers] == sorted(reg.register for _, reg in emma_registers)
+
+
+def _encode_decode(register_name: str, value):
+    register = REGISTERS[register_name]
+
+    builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.BIG)
+    register.encode(value, builder)
+
+    decoder = BinaryPayloadDecoder.fromRegisters(
+        builder.to_registers(),
+        byteorder=Endian.BIG,
+        wordorder=Endian.BIG,
+    )
+    result = register.decode(decoder)
+
+    # decoding straight from the payload bytes, as done for batched reads, must give the same result
+    assert register.decode_from(bytes(2) + b"".join(builder.build()), 2) == result
+    return result
+
+
+def test_huawei_luna2000_time_of_use_register():
+    value = [
+        HUAWEI_LUNA2000_TimeOfUsePeriod(0, 360, ChargeFlag.CHARGE, (True, True, True, True, True, False, False)),
+        HUAWEI_LUNA2000_TimeOfUsePeriod(
+            1020,
+            1440,
+            ChargeFlag.DISCHARGE,
+            (False, True, False, True, False, True, True),
+        ),
+    ]
+
+    assert _encode_decode(rn.STORAGE_HUAWEI_LUNA2000_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS, value) == value
+
+
+def test_lg_resu_time_of_use_register():
+    value = [
+        LG_RESU_TimeOfUsePeriod(0, 360, 0.125),
+        LG_RESU_TimeOfUsePeriod(1020, 1440, 0.3),
+    ]
+
+    assert _encode_decode(rn.STORAGE_LG_RESU_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS, value) == value
+
+
+def test_charge_discharge_period_register():
+    value = [ChargeDischargePeriod(0, 360, 2500), ChargeDischargePeriod(600, 900, 1000)]
+
+    assert _encode_decode(rn.STORAGE_FIXED_CHARGING_AND_DISCHARGING_PERIODS, value) == value
+
+
+@pytest.mark.parametrize(
+    ("register_name", "raw"),
+    [
+        (rn.INPUT_POWER, [0xFFFF, 0xFC18]),
+        (rn.GRID_EXPORTED_ENERGY, [0xFFFF, 0xFE0C]),
+        (rn.DEVICE_STATUS, [0x0200]),
+        (rn.SYSTEM_TIME, [0x61ED, 0x9E6B]),
+        (rn.MODEL_NAME, [0x5355, 0x4E32, 0x3030, 0x3000] + [0] * 11),
+    ],
+)
+def test_decode_from_matches_decode(register_name: str, raw: list[int]):
+    reg = REGISTERS[register_name]
+    payload = bytes(4) + b"".join(value.to_bytes(2, "big") for value in raw)
+
+    decoder = BinaryPayloadDecoder.fromRegisters(raw, byteorder=Endian.BIG, wordorder=Endian.BIG)
+    assert reg.decode_from(payload, 4) == reg.decode(decoder)
+
+
+def test_decode_follows_decoder_word_order():
+    decoder = BinaryPayloadDecoder.fromRegisters([0xFC18, 0xFFFF], byteorder=Endian.BIG, wordorder=Endian.LITTLE)
+    assert REGISTERS[rn.INPUT_POWER].decode(decoder) == -1000
+
+
+def test_periods_have_no_instance_dict():
+    period = ChargeDischargePeriod(0, 1440, 2500)
+    assert not hasattr(period, "__dict__")
+
+
+def test_decode_enum_unit():
+    register = REGISTERS[rn.STORAGE_UNIT_1_PRODUCT_MODEL]
+
+    assert register.decode_from(bytes([0, 2]), 0) is rv.StorageProductModel.HUAWEI_LUNA2000
+    with pytest.raises(DecodeError):
+        register.decode_from(bytes([0xFF, 0xFE]), 0)
+
+
+@pytest.mark.parametrize(
+    ("register_name", "raw", "expected"),
+    [
+        (rn.ACTIVE_POWER, b"\xff\xff\xff\xfe", -2),
+        (rn.ACTIVE_POWER, b"\xff\xfe\x00\x00", -131072),
+        (rn.POWER_FACTOR, b"\xfc\x18", -1.0),
+    ],
+)
+def test_decode_signed(register_name: str, raw: bytes, expected):
+    assert REGISTERS[register_name].decode_from(raw, 0) == expected
+
+
+@pytest.mark.parametrize("bitfield", [0, 0b1, 0b0000_0001_0000_0001, 0b0111_1111_1111_1111, 0b1111_1111_1111_1111])
+def test_flag_decoder_matches_bitfield_decoder(bitfield: int):
+    for codes in (rv.STATE_CODES_1, rv.ALARM_CODES_1, rv.ALARM_CODES_2, rv.ALARM_CODES_3):
+        assert flag_decoder(codes, bitfield) == bitfield_decoder(codes, bitfield)
+
+
+def test_bitfield_decoder_accepts_definition_dict():
+    assert bitfield_decoder(rv.STATE_CODES_2, 0) == ["Locked", "PV disconnected", "No DSP data collection"]
+    assert bitfield_decoder(rv.STATE_CODES_2, 0b111) == ["Unlocked", "PV connected", "DSP data collection"]